@@ -2,12 +2,18 @@
 Python module for working with Minecraft bedrock edition projects.
 '''
 from __future__ import annotations
-from abc import ABC, abstractmethod, abstractproperty
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import chain
+import os
 import re
+import sys
 
 from typing import (
-    ClassVar, Dict, Iterator, List, NamedTuple, Optional, Reversible, Sequence, Tuple, Type, TypeVar,
+    Callable, ClassVar, DefaultDict, Dict, Iterator, List, NamedTuple, Optional, Reversible, Sequence, Tuple, Type, TypeVar,
     Generic, Union)
 from pathlib import Path
 
@@ -31,35 +37,89 @@ UNIQUE_MC_FILE_JSON_MULTI = TypeVar(
 RP_SOUNDS_JSON_PART = TypeVar('RP_SOUNDS_JSON_PART', bound='_RpSoundsJsonPart')
 RP_SOUNDS_JSON_PART_KEY = TypeVar('RP_SOUNDS_JSON_PART_KEY')
 # PROJECT
+def _find_pack_paths(path: Path) -> List[Path]:
+    '''
+    Returns the paths to the subdirectories of a directory that have a
+    manifest.json file (the paths to the packs). Returns empty list if the
+    path is not a directory.
+
+    :param path: the path to the directory with the packs (for example
+        behavior_packs directory of a world).
+    '''
+    result: List[Path] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if (
+                        entry.is_dir() and
+                        os.path.isfile(
+                            os.path.join(entry.path, 'manifest.json'))):
+                    result.append(Path(entry.path))
+    except OSError:
+        pass
+    return result
+
+def _load_manifests(packs: Sequence[_Pack]) -> None:
+    '''
+    Loads the manifests of multiple packs in parallel so the following
+    accesses to their :attr:`_Pack.manifest` properties use the cached
+    results.
+
+    :param packs: the packs to load the manifests of.
+    '''
+    packs = [pack for pack in packs if pack._manifest is None]
+    if len(packs) < 2:
+        return  # Not worth starting the threads
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(packs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(lambda pack: pack.manifest, packs):
+            pass
+
 class Project:
     '''
     A collection of behavior packs and resource packs. Can represent behavior
     and resource packs attached to Minecraft world.
     '''
+    __slots__ = ('_bps', '_rps', '_bps_tuple', '_rps_tuple', '_queries')
     def __init__(self, path: Optional[Path]=None) -> None:
         self._bps: List[BehaviorPack] = []  # Read only (use bps)
         self._rps: List[ResourcePack] = []  # Read only (use rps)
+        # Cached results of bps and rps (reset by add_bp and add_rp)
+        self._bps_tuple: Optional[Tuple[BehaviorPack, ...]] = None
+        self._rps_tuple: Optional[Tuple[ResourcePack, ...]] = None
+        # Cached results of the bp_* and rp_* properties mapped to the types
+        # of the collections or unique files that they query (reset by add_bp
+        # and add_rp)
+        self._queries: Dict[
+            type, Union[_McFileCollectionQuery, _UniqueMcFileJsonMultiQuery]
+        ] = {}
         if path is not None:
-            bps_path = path / 'behavior_packs'
-            rps_path = path / 'resource_packs'
-            if bps_path.is_dir():
-                for p in bps_path.iterdir():
-                    if p.is_dir():
-                        self._bps.append(BehaviorPack(p, self))
-            if rps_path.is_dir():
-                for p in rps_path.iterdir():
-                    if p.is_dir():
-                        self._rps.append(ResourcePack(p, self))
+            # Directories without manifest.json are not packs. The behavior
+            # packs and resource packs are listed in parallel to overlap
+            # waiting for slow (e.g. network) file systems.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                bp_paths = executor.submit(
+                    _find_pack_paths, path / 'behavior_packs')
+                rp_paths = executor.submit(
+                    _find_pack_paths, path / 'resource_packs')
+                for p in bp_paths.result():
+                    self._bps.append(BehaviorPack(p, self))
+                for p in rp_paths.result():
+                    self._rps.append(ResourcePack(p, self))
 
     @property
     def bps(self) -> Tuple[BehaviorPack, ...]:
         '''Tuple with behavior packs from this :class:`Project`'''
-        return tuple(self._bps)
+        if self._bps_tuple is None:
+            self._bps_tuple = tuple(self._bps)
+        return self._bps_tuple
 
     @property
     def rps(self) -> Tuple[ResourcePack, ...]:
         '''Tuple with resource packs from this :class:`Project`'''
-        return tuple(self._rps)
+        if self._rps_tuple is None:
+            self._rps_tuple = tuple(self._rps)
+        return self._rps_tuple
 
     def uuid_bps(self) -> Dict[str, BehaviorPack]:
         '''
@@ -68,9 +128,11 @@ class Project:
         as dict keys). The packs without UUID are skipped.
         '''
         result: Dict[str, BehaviorPack] = {}
+        _load_manifests(self.bps)
         for bp in self.bps:
-            if bp.uuid is not None:
-                result[bp.uuid] = bp
+            uuid = bp.uuid
+            if uuid is not None:
+                result[uuid] = bp
         return result
 
     def uuid_rps(self) -> Dict[str, ResourcePack]:
@@ -80,9 +142,11 @@ class Project:
         as dict keys). The packs without UUID are skipped.
         '''
         result: Dict[str, ResourcePack] = {}
+        _load_manifests(self.rps)
         for rp in self.rps:
-            if rp.uuid is not None:
-                result[rp.uuid] = rp
+            uuid = rp.uuid
+            if uuid is not None:
+                result[uuid] = rp
         return result
 
     def path_bps(self) -> Dict[Path, BehaviorPack]:
@@ -91,10 +155,7 @@ class Project:
         belong to this :class:`Project` to their paths (the paths are used
         as dict keys).
         '''
-        result: Dict[Path, BehaviorPack] = {}
-        for bp in self.bps:
-            result[bp.path] = bp
-        return result
+        return {bp.path: bp for bp in self.bps}
 
     def path_rps(self) -> Dict[Path, ResourcePack]:
         '''
@@ -102,10 +163,7 @@ class Project:
         belong to this :class:`Project` to their paths (the paths are used
         as dict keys).
         '''
-        result: Dict[Path, ResourcePack] = {}
-        for rp in self.rps:
-            result[rp.path] = rp
-        return result
+        return {rp.path: rp for rp in self.rps}
 
     def add_bp(self, pack: BehaviorPack) -> None:
         '''
@@ -114,6 +172,8 @@ class Project:
         :param pack: the behavior pack
         '''
         self._bps.append(pack)
+        self._bps_tuple = None
+        self._queries.clear()
         pack.project = self
 
     def add_rp(self, pack: ResourcePack) -> None:
@@ -123,8 +183,53 @@ class Project:
         :param pack: the resource pack
         '''
         self._rps.append(pack)
+        self._rps_tuple = None
+        self._queries.clear()
         pack.project = self
 
+    def _get_collection_query(
+            self, collections_type: Type[_McFileCollection[MCPACK, MCFILE]],
+            packs: Sequence[MCPACK],
+            get_collection: Callable[
+                [MCPACK], _McFileCollection[MCPACK, MCFILE]]
+    ) -> _McFileCollectionQuery[MCFILE]:
+        '''
+        Used internally - returns the cached :class:`_McFileCollectionQuery`
+        of the collections of certain type from the packs of this project
+        (creates it if it doesn't exist).
+
+        :param collections_type: the type of the collections.
+        :param packs: the packs of this project (:attr:`bps` or :attr:`rps`).
+        :param get_collection: a function that returns the collection from a
+            pack.
+        '''
+        query = self._queries.get(collections_type)
+        if query is None:
+            query = _McFileCollectionQuery(
+                collections_type, [get_collection(pack) for pack in packs])
+            self._queries[collections_type] = query
+        return query  # type: ignore
+
+    def _get_unique_file_query(
+            self, file_type: Type[UNIQUE_MC_FILE_JSON_MULTI],
+            get_file: Callable[[ResourcePack], UNIQUE_MC_FILE_JSON_MULTI]
+    ) -> _UniqueMcFileJsonMultiQuery[UNIQUE_MC_FILE_JSON_MULTI]:
+        '''
+        Used internally - returns the cached
+        :class:`_UniqueMcFileJsonMultiQuery` of the unique files of certain
+        type from the resource packs of this project (creates it if it
+        doesn't exist).
+
+        :param file_type: the type of the unique files.
+        :param get_file: a function that returns the file from a pack.
+        '''
+        query = self._queries.get(file_type)
+        if query is None:
+            query = _UniqueMcFileJsonMultiQuery(
+                [get_file(pack) for pack in self.rps])
+            self._queries[file_type] = query
+        return query  # type: ignore
+
     @property
     def bp_entities(
             self) -> _McFileCollectionQuery[BpEntity]:
@@ -132,8 +237,8 @@ class Project:
         Returns a file collection of all behavior pack entities from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            BpEntities, [i.entities for i in self.bps])
+        return self._get_collection_query(
+            BpEntities, self.bps, lambda bp: bp.entities)
 
     @property
     def rp_entities(
@@ -142,8 +247,8 @@ class Project:
         Returns a file collection of all resource pack entities from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            RpEntities, [i.entities for i in self.rps])
+        return self._get_collection_query(
+            RpEntities, self.rps, lambda rp: rp.entities)
 
     @property
     def bp_animation_controllers(
@@ -152,9 +257,9 @@ class Project:
         Returns a file collection of all behavior pack animation controllers
         from this :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            BpAnimationControllers,
-            [i.animation_controllers for i in self.bps])
+        return self._get_collection_query(
+            BpAnimationControllers, self.bps,
+            lambda bp: bp.animation_controllers)
 
     @property
     def rp_animation_controllers(
@@ -163,9 +268,9 @@ class Project:
         Returns a file collection of all resource pack animation controllers
         from this :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            RpAnimationControllers,
-            [i.animation_controllers for i in self.rps])
+        return self._get_collection_query(
+            RpAnimationControllers, self.rps,
+            lambda rp: rp.animation_controllers)
 
     @property
     def bp_blocks(
@@ -174,7 +279,8 @@ class Project:
         Returns a file collection of all behavior pack blocks from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(BpBlocks, [i.blocks for i in self.bps])
+        return self._get_collection_query(
+            BpBlocks, self.bps, lambda bp: bp.blocks)
 
     @property
     def bp_items(
@@ -183,7 +289,8 @@ class Project:
         Returns a file collection of all behavior pack items from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(BpItems, [i.items for i in self.bps])
+        return self._get_collection_query(
+            BpItems, self.bps, lambda bp: bp.items)
 
     @property
     def rp_items(
@@ -192,7 +299,8 @@ class Project:
         Returns a file collection of all resource pack items from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(RpItems, [i.items for i in self.rps])
+        return self._get_collection_query(
+            RpItems, self.rps, lambda rp: rp.items)
 
     @property
     def bp_loot_tables(
@@ -201,8 +309,8 @@ class Project:
         Returns a file collection of all behavior pack loot tables from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            BpLootTables, [i.loot_tables for i in self.bps])
+        return self._get_collection_query(
+            BpLootTables, self.bps, lambda bp: bp.loot_tables)
 
     @property
     def bp_functions(
@@ -211,8 +319,8 @@ class Project:
         Returns a file collection of all behavior pack functions from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            BpFunctions, [i.functions for i in self.bps])
+        return self._get_collection_query(
+            BpFunctions, self.bps, lambda bp: bp.functions)
 
     @property
     def rp_sound_files(
@@ -221,8 +329,8 @@ class Project:
         Returns a file collection of all resource pack sound files from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            RpSoundFiles, [i.sound_files for i in self.rps])
+        return self._get_collection_query(
+            RpSoundFiles, self.rps, lambda rp: rp.sound_files)
 
     @property
     def rp_texture_files(
@@ -231,8 +339,8 @@ class Project:
         Returns a file collection of all resource pack texture files from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            RpTextureFiles, [i.texture_files for i in self.rps])
+        return self._get_collection_query(
+            RpTextureFiles, self.rps, lambda rp: rp.texture_files)
 
     @property
     def bp_spawn_rules(
@@ -241,8 +349,8 @@ class Project:
         Returns a file collection of all behavior pack spawn rules from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            BpSpawnRules, [i.spawn_rules for i in self.bps])
+        return self._get_collection_query(
+            BpSpawnRules, self.bps, lambda bp: bp.spawn_rules)
 
     @property
     def bp_trades(
@@ -251,7 +359,8 @@ class Project:
         Returns a file collection of all behavior pack trades from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(BpTrades, [i.trades for i in self.bps])
+        return self._get_collection_query(
+            BpTrades, self.bps, lambda bp: bp.trades)
 
     @property
     def bp_recipes(
@@ -260,7 +369,8 @@ class Project:
         Returns a file collection of all behavior pack recipes from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(BpRecipes, [i.recipes for i in self.bps])
+        return self._get_collection_query(
+            BpRecipes, self.bps, lambda bp: bp.recipes)
 
     @property
     def rp_models(
@@ -269,7 +379,8 @@ class Project:
         Returns a file collection of all resource pack models from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(RpModels, [i.models for i in self.rps])
+        return self._get_collection_query(
+            RpModels, self.rps, lambda rp: rp.models)
 
     @property
     def rp_particles(
@@ -278,8 +389,8 @@ class Project:
         Returns a file collection of all resource pack particles from this
         :class:`Project`.
         '''
-        return _McFileCollectionQuery(
-            RpParticles, [i.particles for i in self.rps])
+        return self._get_collection_query(
+            RpParticles, self.rps, lambda rp: rp.particles)
 
     @property
     def rp_render_controllers(
@@ -288,8 +399,8 @@ class Project:
         Returns a file collection of all resource pack render controllers
         from this :class:`Project`.
         '''
-        return  _McFileCollectionQuery(
-            RpRenderControllers, [i.render_controllers for i in self.rps])
+        return self._get_collection_query(
+            RpRenderControllers, self.rps, lambda rp: rp.render_controllers)
 
     @property
     def rp_sound_definitions_json(
@@ -298,8 +409,8 @@ class Project:
         Returns a unique file collection of all resource pack
         sound_definitions.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.sound_definitions_json for i in self.rps])
+        return self._get_unique_file_query(
+            BpEntity, lambda rp: rp.sound_definitions_json)
 
     @property
     def rp_blocks_json(
@@ -308,7 +419,8 @@ class Project:
         Returns a unique file collection of all resource pack blocks.json files
         from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery([i.blocks_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpBlocksJson, lambda rp: rp.blocks_json)
 
     @property
     def rp_music_definitions_json(
@@ -317,8 +429,8 @@ class Project:
         Returns a unique file collection of all resource pack
         music_definitions.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.music_definitions_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpMusicDefinitionsJson, lambda rp: rp.music_definitions_json)
 
     @property
     def rp_biomes_client_json(
@@ -327,8 +439,8 @@ class Project:
         Returns a unique file collection of all resource pack
         biomes_client.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.biomes_client_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpBiomesClientJson, lambda rp: rp.biomes_client_json)
 
     @property
     def rp_item_texture_json(
@@ -337,8 +449,8 @@ class Project:
         Returns a unique file collection of all resource pack
         item_texture.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.item_texture_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpItemTextureJson, lambda rp: rp.item_texture_json)
 
     @property
     def rp_flipbook_textures_json(
@@ -347,8 +459,8 @@ class Project:
         Returns a unique file collection of all resource pack
         flipbook_textures.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.flipbook_textures_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpFlipbookTexturesJson, lambda rp: rp.flipbook_textures_json)
 
     @property
     def rp_terrain_texture_json(
@@ -357,8 +469,8 @@ class Project:
         Returns a unique file collection of all resource pack
         terrain_texture.json files from this :class:`Project`.
         '''
-        return _UniqueMcFileJsonMultiQuery(
-            [i.terrain_texture_json for i in self.rps])
+        return self._get_unique_file_query(
+            RpTerrainTextureJson, lambda rp: rp.terrain_texture_json)
 
 
 # PACKS
@@ -367,6 +479,7 @@ class _Pack(ABC):
     Behavior pack or resource pack. A collection of
     :class:`_McFileCollection`.
     '''
+    __slots__ = ('project', 'path', '_manifest')
     def __init__(self, path: Path, project: Optional[Project]=None) -> None:
         self.project: Optional[Project] = project
         self.path: Path = path
@@ -378,9 +491,8 @@ class _Pack(ABC):
         if self._manifest is None:
             manifest_path = self.path / 'manifest.json'
             try:
-                with manifest_path.open('r') as f:
-                    self._manifest = JsonWalker.load(f)
-            except:
+                self._manifest = JsonWalker.loads(manifest_path.read_bytes())
+            except (OSError, ValueError):
                 return None
         return self._manifest
 
@@ -397,6 +509,18 @@ class BehaviorPack(_Pack):
     '''
     A collection of all files collections related to Minecraft behavior pack.
     '''
+    __slots__ = (
+        '_entities',
+        '_animation_controllers',
+        '_animations',
+        '_blocks',
+        '_items',
+        '_loot_tables',
+        '_functions',
+        '_spawn_rules',
+        '_trades',
+        '_recipes',
+    )
     def __init__(self, path: Path, project: Optional[Project]=None) -> None:
         super().__init__(path, project=project)
         self._entities: Optional[BpEntities] = None
@@ -484,6 +608,25 @@ class ResourcePack(_Pack):
     '''
     A collection of all files collections related to Minecraft resource pack.
     '''
+    __slots__ = (
+        '_entities',
+        '_animation_controllers',
+        '_animations',
+        '_items',
+        '_models',
+        '_particles',
+        '_render_controllers',
+        '_sound_definitions_json',
+        '_sounds_json',
+        '_blocks_json',
+        '_music_definitions_json',
+        '_biomes_client_json',
+        '_item_texture_json',
+        '_flipbook_textures_json',
+        '_terrain_texture_json',
+        '_sound_files',
+        '_texture_files',
+    )
     def __init__(self, path: Path, project: Optional[Project]=None) -> None:
         super().__init__(path, project=project)
         self._entities: Optional[RpEntities] = None
@@ -624,13 +767,73 @@ class ResourcePack(_Pack):
         return self._texture_files
 
 # OBJECT COLLECTIONS (GENERIC)
+# The smallest number of files in a collection for which the identifiers are
+# read by multiple threads (starting the threads costs more than reading a
+# few small files)
+_MIN_FILES_FOR_THREADS = 16
+
+def _normalize_path_key(path: Union[Path, str]) -> str:
+    '''
+    Used internally - returns the string used as a key of a path in the
+    indices of the :class:`_McFileCollection` objects. The paths are
+    normalized with :func:`os.path.normpath` and :func:`os.path.normcase`
+    so the lookups are case-insensitive on Windows (like the comparison of
+    :class:`Path` objects).
+
+    :param path: the path to the file.
+    '''
+    return os.path.normcase(os.path.normpath(path))
+
+def _walk_files(path: Path, suffixes: Tuple[str, ...]) -> Iterator[str]:
+    '''
+    Yields the paths to the files with certain suffixes from a directory and
+    its subdirectories. Uses :func:`os.scandir` which (unlike
+    :meth:`Path.glob`) knows the types of the files without additional
+    system calls. Doesn't follow the symlinks to directories.
+
+    :param path: the path to the directory.
+    :param suffixes: the lowercase suffixes of the names of the files (e.g.
+        ".json"). On case-insensitive platforms (Windows) the case of the
+        names is ignored (like in :meth:`Path.glob`).
+    '''
+    normcase = os.path.normcase
+    stack: List[str] = [os.fspath(path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs: List[str] = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif (
+                        normcase(entry.name).endswith(suffixes) and
+                        entry.is_file()):
+                    yield entry.path
+        # Reversed, so the subdirectories are visited in the order of the
+        # scan (like in Path.glob)
+        stack.extend(reversed(subdirs))
+
 class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
     '''
     Collection of files that contain objects of a certain type (
     :class:`_McFile` collection).
     '''
+    __slots__ = (
+        '_objects', '_files_walker', '_pack', '_path', '_path_ids',
+        '_id_items', '_identifier_prefix', '_pack_path_cache')
     pack_path: ClassVar[str]
-    file_patterns: ClassVar[Tuple[str, ...]]
+    # The lowercase suffixes of the names of the files (searched recursively
+    # in path)
+    file_suffixes: ClassVar[Tuple[str, ...]]
+    # The path (relative to the pack) used as the root of the identifiers of
+    # the files that use their paths as identifiers
+    _identifier_base: ClassVar[str] = ''
+    # True if the identifiers of the files are their paths (getting them
+    # doesn't read the files)
+    _ids_from_paths: ClassVar[bool] = False
 
     def __init__(
             self, *,
@@ -647,9 +850,17 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
                 f'{type(self).__name__} constructor')
 
         self._objects: Optional[List[MCFILE]] = None  # Lazy evaluation
+        # The walker that finds the files for _objects (None when done)
+        self._files_walker: Optional[Iterator[str]] = None
         self._pack: Optional[MCPACK] = pack  # read only (use pack)
         self._path: Optional[Path] = path  # read only (use path)
-
+        # Lazy evaluation (use _quick_access_list_views)
+        self._path_ids: Optional[Dict[str, List[str]]] = None
+        self._id_items: Optional[Dict[str, List[MCFILE]]] = None
+        # Lazy evaluation (use _get_identifier_prefix)
+        self._identifier_prefix: Optional[Tuple[Path, str]] = None
+        # The path of the pack and the path created from it (use path)
+        self._pack_path_cache: Optional[Tuple[Path, Path]] = None
 
     @property
     def objects(self) -> List[MCFILE]:
@@ -657,24 +868,49 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
         The list of all :class:`_McFile` objects that belong to this
         collection.
         '''
+        if self._objects is None or self._files_walker is not None:
+            for _ in self.iter_objects():
+                pass
+        return self._objects  # type: ignore
+
+    def iter_objects(self) -> Iterator[MCFILE]:
+        '''
+        Yields the :class:`_McFile` objects that belong to this collection.
+        Lazy version of :attr:`objects` - the files are found while
+        iterating, so stopping the iteration early skips searching for the
+        rest of them. The found objects are cached and reused by following
+        iterations and by :attr:`objects`.
+        '''
         if self._objects is None:
             self._objects = []
-            for file_pattern in self.__class__.file_patterns:
-                for fp in self.path.glob(file_pattern):
-                    if not fp.is_file():
-                        continue
-                    try:
-                        obj: MCFILE = self._make_collection_object(fp)
-                    except AttributeError:
-                        continue
-                    self._objects.append(obj)
-        return self._objects
+            self._files_walker = _walk_files(
+                self.path, self.__class__.file_suffixes)
+        objects = self._objects
+        i = 0
+        while True:
+            while i < len(objects):
+                yield objects[i]
+                i += 1
+            if self._files_walker is None:
+                return
+            fp = next(self._files_walker, None)
+            if fp is None:
+                self._files_walker = None
+            else:
+                objects.append(self._make_collection_object(fp))
 
     @property
     def path(self) -> Path:
         '''The path to this file collection.'''
         if self.pack is not None:  # Get path from pack
-            return self.pack.path / self.__class__.pack_path
+            pack_path = self.pack.path
+            # The path of the pack is a public attribute, the cached path is
+            # used only if it didn't change
+            cache = self._pack_path_cache
+            if cache is None or cache[0] is not pack_path:
+                cache = (pack_path, pack_path / self.__class__.pack_path)
+                self._pack_path_cache = cache
+            return cache[1]
         if self._path is None:
             raise AttributeError("Can't get 'path' attribute.")
         return self._path
@@ -684,6 +920,24 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
         '''The pack that owns this file collection.'''
         return self._pack
 
+    def _get_identifier_prefix(self) -> Optional[str]:
+        '''
+        Used internally - returns the path (as a string that ends with a
+        path separator) that the identifiers of the files which use their
+        paths as identifiers are relative to. Returns None if this
+        collection doesn't belong to a pack.
+        '''
+        if self.pack is None:
+            return None
+        pack_path = self.pack.path
+        # Cached for the current path of the pack (like the path property)
+        cache = self._identifier_prefix
+        if cache is None or cache[0] is not pack_path:
+            cache = (pack_path, os.path.join(
+                pack_path / self.__class__._identifier_base, ''))
+            self._identifier_prefix = cache
+        return cache[1]
+
 
     def __iter__(self) -> Iterator[MCFILE]:
         '''
@@ -692,8 +946,9 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
         first one is returned. If you want to iterate over every file use
         the "objects" property.
         '''
-        for k in self.keys():
-            yield self[:k:0]
+        _, id_items = self._quick_access_list_views()
+        for obj_list in id_items.values():
+            yield obj_list[0]
 
     def __getitem__(self, key: Union[str, slice]) -> MCFILE:
         '''
@@ -712,12 +967,17 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
             :class:`_McFile` (path, identifier and index) that let you identify
             an object that you want to access from the collection.
         '''
-        path_ids, id_items = self._quick_access_list_views()
         path_key: Optional[Union[str, Path]]
         id_key: Optional[str]
         index: Optional[int]
         if isinstance(key, str):
-            path_key, id_key, index = None, key, None
+            # Fast path for the most common case - unique identifier with
+            # already built index
+            if self._id_items is not None:
+                obj_list = self._id_items.get(key)
+                if obj_list is not None and len(obj_list) == 1:
+                    return obj_list[0]
+            return self.get_by_id(key)
         elif isinstance(key, slice):
             path_key, id_key, index = key.start, key.stop, key.step
         else:
@@ -725,51 +985,86 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
                 'key must be a string or slice or slices, not '
                 f'{type(key).__name__}')
         # Check key types
-        if not isinstance(id_key, (str, type(None))):
+        if id_key is not None and not isinstance(id_key, str):
             raise TypeError(
                 'identifier key must be a string, not '
                 f'{type(id_key).__name__}')
-        if not isinstance(path_key, (Path, str, type(None))):
+        if path_key is not None and not isinstance(path_key, (Path, str)):
             raise TypeError(
                 'path key must be a string, Path or None, not '
                 f'{type(path_key).__name__}')
-        if not isinstance(index, (int, type(None))):
+        if index is not None and not isinstance(index, int):
             raise TypeError(
                 'index key must be an integer, not '
                 f'{type(index).__name__}')
         # Access the object
-        if path_key is not None:
-            path_key = Path(path_key)
-            # The length of this list is > 0 because path_ids don't have empty
-            # lists
-            id_list = path_ids[path_key]
-            if id_key is None:
-                if len(id_list) == 1:
-                    id_key = id_list[0]
-                else:
-                    raise KeyError(key)
-            elif id_key not in id_list:
-                raise KeyError(key)
-            obj_list = id_items[id_key]
-        else:  # path_key is None
-            if id_key is None:
-                raise KeyError(key)
-            obj_list = id_items[id_key]
-        # Search narrowed down to list of objects and the index
-        # The return statement
+        try:
+            if path_key is not None:
+                return self.get_by_path(path_key, id_key, index)
+            if id_key is not None:
+                return self.get_by_id(id_key, index)
+        except KeyError:
+            raise KeyError(key) from None  # The original key, not its part
+        raise KeyError(key)
+
+    def get_by_id(self, identifier: str, index: Optional[int]=None) -> MCFILE:
+        '''
+        Get a file that belongs to this collection by using its identifier.
+        Same as :code:`collection[:identifier:index]` but without checking
+        the types of the arguments.
+
+        :param identifier: the identifier used by Minecraft to identify the
+            object in the file.
+        :param index: in case of multiple files that have the same identifier
+            (which shouldn't happen in a valid pack), this property can be used
+            to select one of them.
+        '''
+        obj_list = self._quick_access_list_views()[1].get(identifier)
+        if obj_list is None:
+            raise KeyError(identifier)
         if index is not None:
             return obj_list[index]
         elif len(obj_list) == 1:
             return obj_list[0]
-        raise KeyError(key)
+        raise KeyError(identifier)
+
+    def get_by_path(
+            self, path: Union[Path, str], identifier: Optional[str]=None,
+            index: Optional[int]=None) -> MCFILE:
+        '''
+        Get a file that belongs to this collection by using its path.
+        Same as :code:`collection[path:identifier:index]` but without checking
+        the types of the arguments.
+
+        :param path: the path to the file.
+        :param identifier: the identifier used by Minecraft to identify the
+            object in the file. Can be omitted if the file contains only one
+            object.
+        :param index: in case of multiple files that have the same identifier
+            (which shouldn't happen in a valid pack), this property can be used
+            to select one of them.
+        '''
+        path_ids = self._quick_access_list_views()[0]
+        # The length of this list is > 0 because path_ids don't have empty
+        # lists
+        id_list = path_ids.get(_normalize_path_key(path))
+        if id_list is None:
+            raise KeyError(path)
+        if identifier is None:
+            if len(id_list) != 1:
+                raise KeyError(path)
+            identifier = id_list[0]
+        elif identifier not in id_list:
+            raise KeyError(identifier)
+        return self.get_by_id(identifier, index)
 
-    # Different for _McFileMulti and _McFileSingle collections
-    @abstractmethod
     def keys(self) -> Tuple[str, ...]:
         '''
         The list of the identifiers that can be used for __getitem__ method
         of this collection.
         '''
+        _, id_items = self._quick_access_list_views()
+        return tuple(id_items.keys())
 
     @classmethod
     def _get_item_from_combined_collections(
@@ -786,26 +1081,78 @@ class _McFileCollection(Generic[MCPACK, MCFILE], ABC):
             :class:`_McFile` (path, identifier and index) that let you identify
             an object that you want to access from the collection.
         '''
+        if isinstance(key, str):
+            # Fast path without raising and catching KeyError for every
+            # collection. Same as collection[key] - the identifier must be
+            # unique in the collection.
+            for collection in reversed(collections):
+                obj_list = collection._quick_access_list_views()[1].get(key)
+                if obj_list is not None and len(obj_list) == 1:
+                    return obj_list[0]
+            raise KeyError(key)
         for collection in reversed(collections):
             try:
                 return collection[key]
-            except:
+            except (KeyError, IndexError):
                 pass
         raise KeyError(key)
 
-    @abstractmethod
     def _quick_access_list_views(
-            self) -> Tuple[Dict[Path, List[str]], Dict[str, List[MCFILE]]]:
+            self) -> Tuple[Dict[str, List[str]], Dict[str, List[MCFILE]]]:
         '''
         Used internally - returns two dictionaries that let you access the
         the data of this collection quickly. First dictionary maps identifiers
-        to :class:`_McFile` objects paths from this collection. The
-        second dictionary maps the :class:`_McFile` lists to
-        identifiers of the Minecraft objects in these files.
+        to :class:`_McFile` objects paths from this collection (normalized
+        with :func:`_normalize_path_key`). The second dictionary maps the
+        :class:`_McFile` lists to identifiers of the Minecraft objects in
+        these files. The dictionaries are built on the first call and
+        rebuilt after the path of one of the files changes.
+        '''
+        if self._path_ids is not None and self._id_items is not None:
+            return (self._path_ids, self._id_items)
+        path_ids: DefaultDict[str, List[str]] = defaultdict(list)
+        id_items: DefaultDict[str, List[MCFILE]] = defaultdict(list)
+        objects = self.objects
+        if (
+                self.__class__._ids_from_paths or
+                len(objects) < _MIN_FILES_FOR_THREADS):
+            # Not worth starting the threads
+            all_ids = [self._extract_ids(obj) for obj in objects]
+        else:
+            # Getting the identifiers parses the files which is the slowest
+            # part of loading the collection. The files are independent from
+            # each other. Reading the files releases the GIL so there can be
+            # more threads than CPUs.
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(objects))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                all_ids = list(executor.map(self._extract_ids, objects))
+        # The same identifiers are used in many files and collections
+        intern = sys.intern
+        for obj, ids in zip(objects, all_ids):
+            if len(ids) == 0:
+                continue
+            obj_path_ids = path_ids[_normalize_path_key(obj._path)]
+            for identifier in ids:
+                identifier = intern(identifier)
+                obj_path_ids.append(identifier)
+                id_items[identifier].append(obj)
+        # Plain dicts don't insert empty lists for missing keys on lookup
+        self._path_ids = dict(path_ids)
+        self._id_items = dict(id_items)
+        return (self._path_ids, self._id_items)
+
+    # Different for _McFileMulti and _McFileSingle collections
+    @abstractmethod
+    def _extract_ids(self, obj: MCFILE) -> Tuple[str, ...]:
+        '''
+        Used internally - returns the identifiers of the Minecraft objects
+        from an :class:`_McFile` that belongs to this collection.
+
+        :param obj: the :class:`_McFile` to get the identifiers from.
         '''
 
     @abstractmethod
-    def _make_collection_object(self, path: Path) -> MCFILE:
+    def _make_collection_object(self, path: Union[Path, str]) -> MCFILE:
         '''
         Used internally - create an :class:`_McFile` from a path
         and add to this collection.
@@ -820,11 +1167,13 @@ class _McFileCollectionQuery(Generic[MCFILE]):
     Used by :class:`Project` to provide methods for finding :class:`McFile` in
     groups of :class:`McFileCollection` objects that belong to that project.
     '''
+    __slots__ = ('collections', 'collections_type')
     def __init__(
             self,
             collections_type: Type[_McFileCollection[MCPACK, MCFILE]],
             collections: Sequence[_McFileCollection[MCPACK, MCFILE]]):
-        self.collections = collections
+        self.collections: Tuple[_McFileCollection[MCPACK, MCFILE], ...] = (
+            tuple(collections))
         self.collections_type = collections_type
 
     def __getitem__(self, key: Union[str, slice]) -> MCFILE:
@@ -845,8 +1194,15 @@ class _McFileCollectionQuery(Generic[MCFILE]):
         method. If multiple McFiles use the same key only the first one is
         returned.
         '''
-        for key in self.keys():
-            yield self[:key:0]
+        # The collections which are later on the list override the earlier
+        # ones. Assigning to an existing key of a dict doesn't change its
+        # position so the order is the same as in keys().
+        result: Dict[str, MCFILE] = {}
+        for collection in self.collections:
+            _, id_items = collection._quick_access_list_views()
+            for key, obj_list in id_items.items():
+                result[key] = obj_list[0]
+        yield from result.values()
 
     def keys(self) -> Tuple[str, ...]:
         '''
@@ -854,23 +1210,126 @@ class _McFileCollectionQuery(Generic[MCFILE]):
         :class:`_McFile` objects from the collections that belong to this
         :class:`_McFileCollectionQuery`.
         '''
-        result: List[str] = []
-        for collection in self.collections:
-            result.extend(collection.keys())
-        return tuple(set(result))
+        # dict.fromkeys removes the duplicates and keeps the order
+        return tuple(dict.fromkeys(chain.from_iterable(
+            collection.keys() for collection in self.collections)))
 
 # OBJECTS (GENERIC)
+def _get_json_path_str(walker: JsonWalker, *keys: str) -> Optional[str]:
+    '''
+    Used internally - returns the string from the end of a path of JSON
+    object keys or None if the path doesn't exist or doesn't point at a
+    string. Works like a chain of :code:`/` operators on the
+    :class:`JsonWalker` but doesn't create any intermediate
+    :class:`JsonWalker` objects.
+
+    :param walker: the :class:`JsonWalker` where the path starts.
+    :param keys: the keys of the JSON objects on the path.
+    '''
+    data = walker.data
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    if isinstance(data, str):
+        return data
+    return None
+
+# Used by _get_json_item to tell apart missing keys from null values
+_MISSING = object()
+
+def _get_json_item(walker: JsonWalker, key: str) -> JsonWalker:
+    '''
+    Used internally - returns the :class:`JsonWalker` of the value of a key
+    of the JSON object from the walker. Works like :code:`walker / key`
+    but uses single dictionary lookup and raises :class:`KeyError` instead
+    of returning a :class:`JsonWalker` with an exception if the key doesn't
+    exist.
+
+    :param walker: the :class:`JsonWalker` with the JSON object.
+    :param key: the key of the JSON object.
+    '''
+    data = walker.data
+    if isinstance(data, dict):
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return JsonWalker(value, parent=walker, parent_key=key)
+    raise KeyError(key)
+
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    '''
+    Used internally - converts a "format_version" string into a tuple of
+    integers. Only a few distinct versions are used in the packs so the
+    results are cached.
+
+    :param version: the version string (e.g. "1.16.0").
+    :raises: :class:`ValueError` if the version is not a dot separated list
+        of integers.
+    '''
+    return tuple([int(i) for i in version.split('.')])
+
+# The decoder doesn't store any state between decode() calls so it can be
+# shared by all files (and threads) to avoid creating it for every file
+_JSONC_DECODER = JSONCDecoder()
+
+def _load_jsonc_file(path: Union[Path, str]) -> JsonWalker:
+    '''
+    Creates :class:`JsonWalker` from a JSON file that can have comments.
+    Most of the files don't have comments so at first the file is parsed
+    with a fast parser (orjson if it's installed or the standard json
+    module). The slow :class:`JSONCDecoder` is used only if that fails.
+
+    :param path: the path to the file.
+    :rises: :class:`OSError` if the file can't be read or
+        :class:`ValueError` if it isn't valid JSON with comments.
+    '''
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        return JsonWalker.loads(data)
+    except ValueError:
+        return JsonWalker.loads_with(_JSONC_DECODER, data)
+
 class _McFile(Generic[MCFILE_COLLECTION], ABC):
     '''
     A file that can contain objects used in Minecraft packs.
     '''
+    __slots__ = ('_owning_collection', '_path', '_path_object')
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]=None
     ) -> None:
         self._owning_collection: Optional[
             MCFILE_COLLECTION] = owning_collection
-        self.path: Path = path
+        # The path is stored as str because it's lighter than Path. The Path
+        # object is created on the first access to the path property.
+        self._path: str = os.fspath(path)
+        self._path_object: Optional[Path] = None
+
+    @property
+    def path(self) -> Path:
+        '''The path to this file.'''
+        if self._path_object is None:
+            self._path_object = Path(self._path)
+        return self._path_object
+
+    @path.setter
+    def path(self, path: Union[Path, str]) -> None:
+        self._path = os.fspath(path)
+        self._reset_path_caches()
+
+    def _reset_path_caches(self) -> None:
+        '''
+        Used internally - clears the cached values that depend on the path
+        of this file. Called when the path changes.
+        '''
+        self._path_object = None
+        # The owning collection indexes its files by their paths (and some
+        # of the files use their paths as identifiers)
+        if self._owning_collection is not None:
+            self._owning_collection._path_ids = None
+            self._owning_collection._id_items = None
 
     @property
     def owning_collection(self) -> Optional[MCFILE_COLLECTION]:
@@ -885,41 +1344,100 @@ class _McFileSingle(_McFile[MCFILE_COLLECTION]):
     A file that can contain only one object of certain type from a pack.
     :class:`McFile` with single Minecraft object
     '''
-    @abstractproperty
+    __slots__ = ('_identifier',)
+    def __init__(
+            self, path: Union[Path, str],
+            owning_collection: Optional[MCFILE_COLLECTION]=None
+    ) -> None:
+        super().__init__(path, owning_collection=owning_collection)
+        # The cached identifier of the files that use their paths as
+        # identifiers (use _get_path_identifier)
+        self._identifier: Optional[str] = None
+
+    def _reset_path_caches(self) -> None:
+        super()._reset_path_caches()
+        # Some of the files use their paths as identifiers
+        self._identifier = None
+
+    @property
+    @abstractmethod
     def identifier(self) -> Optional[str]:
         '''
         The identifier of a Minecraft object contained in this file.
         '''
 
+    def _get_path_identifier(self, strip_suffix: bool) -> Optional[str]:
+        '''
+        Used internally - returns the identifier of the files that use
+        their paths (relative to the base path of the owning collection) as
+        identifiers. The result is cached.
+
+        :param strip_suffix: whether the suffix of the file should be removed
+            from the identifier.
+        '''
+        if self._identifier is not None:
+            return self._identifier
+        if self.owning_collection is None:
+            return None
+        prefix = self.owning_collection._get_identifier_prefix()
+        if prefix is None:
+            return None
+        # The paths of the files found by the collection start with the
+        # prefix so usually the identifier can be sliced out of the path
+        # without creating Path objects.
+        if self._path.startswith(prefix):
+            identifier = self._path[len(prefix):]
+            if strip_suffix:
+                identifier = os.path.splitext(identifier)[0]
+            self._identifier = identifier.replace(os.sep, '/')
+        else:
+            path = self.path.relative_to(prefix)
+            if strip_suffix:
+                path = path.with_suffix('')
+            self._identifier = path.as_posix()
+        return self._identifier
+
 class _McFileJsonSingle(_McFileSingle[MCFILE_COLLECTION]):
     '''
     A JSON file that can contain only one object of certain type from a pack.
     :class:`McFile` that has JSON in it, with single Minecraft object.
     '''
+    __slots__ = ('_json',)
+    # The keys of the JSON objects on the path to the identifier (the
+    # subclasses with other kinds of identifiers override the identifier
+    # property instead)
+    _identifier_path: ClassVar[Tuple[str, ...]]
+
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]=None
     ) -> None:
         super().__init__(path, owning_collection=owning_collection)
-        self._json: JsonWalker = JsonWalker(None)
-        try:
-            with path.open('r') as f:
-                self._json = JsonWalker.load(f, cls=JSONCDecoder)
-        except:
-            pass  # self._json remains None walker
+        self._json: Optional[JsonWalker] = None  # Lazy evaluation
 
     @property
     def json(self) -> JsonWalker:
         '''
         A :class:`JsonWalker` with the content of this JSON file.
         '''
+        if self._json is None:
+            try:
+                self._json = _load_jsonc_file(self._path)
+            except:
+                self._json = JsonWalker(None)
         return self._json
 
+    @property
+    def identifier(self) -> Optional[str]:
+        # Not cached, the JSON can be edited through the json property
+        return _get_json_path_str(self.json, *self.__class__._identifier_path)
+
 class _McFileMulti(_McFile[MCFILE_COLLECTION]):
     '''
     A file that can contain multiple objects of certain type from a pack.
     :class:`McFile` with multiple Minecraft objects.
     '''
+    __slots__ = ()
     @abstractmethod
     def keys(self) -> Tuple[str, ...]:
         '''
@@ -931,23 +1449,24 @@ class _McFileJsonMulti(_McFileMulti[MCFILE_COLLECTION]):
     A JSON file that can contain multiple objects of certain type from a pack.
     :class:`McFile` that has JSON in it, with multiple Minecraft objects.
     '''
+    __slots__ = ('_json',)
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]=None
     ) -> None:
         super().__init__(path, owning_collection=owning_collection)
-        self._json: JsonWalker = JsonWalker(None)
-        try:
-            with path.open('r') as f:
-                self._json = JsonWalker.load(f, cls=JSONCDecoder)
-        except:
-            pass  # self._json remains None walker
+        self._json: Optional[JsonWalker] = None  # Lazy evaluation
 
     @property
     def json(self) -> JsonWalker:
         '''
         A :class:`JsonWalker` with the content of this JSON file.
         '''
+        if self._json is None:
+            try:
+                self._json = _load_jsonc_file(self._path)
+            except:
+                self._json = JsonWalker(None)
         return self._json
 
     @abstractmethod
@@ -971,6 +1490,13 @@ class _McFileJsonMulti(_McFileMulti[MCFILE_COLLECTION]):
 # OBJECTS (IMPLEMENTATION)
 class BpEntity(_McFileJsonSingle['BpEntities']):
     '''Behavior pack entity file.'''
+    __slots__ = (
+        '_animations',
+        '_animation_controllers',
+        '_loot_tables',
+        '_trade_tables',
+    )
+    _identifier_path = ("minecraft:entity", "description", "identifier")
     class ConnectAnim(NamedTuple):
         '''A reference inside the entity to an animation'''
         short_name: str
@@ -1011,7 +1537,7 @@ class BpEntity(_McFileJsonSingle['BpEntities']):
         connection_type: BpEntity.ConnectTradeType
 
     def __init__(
-                self, path: Path,
+                self, path: Union[Path, str],
                 owning_collection: Optional[MCFILE_COLLECTION]
             ) -> None:
         super().__init__(path, owning_collection=owning_collection)
@@ -1021,14 +1547,6 @@ class BpEntity(_McFileJsonSingle['BpEntities']):
         self._loot_tables: Optional[Tuple[BpEntity.ConnectLoot, ...]] = None
         self._trade_tables: Optional[Tuple[BpEntity.ConnectTrade, ...]] = None
 
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:entity" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
-
     @property
     def animations(self) -> Tuple[BpEntity.ConnectAnim, ...]:
         '''
@@ -1139,6 +1657,18 @@ class BpEntity(_McFileJsonSingle['BpEntities']):
 
 class RpEntity(_McFileJsonSingle['RpEntities']):
     '''Resource pack entity file.'''
+    __slots__ = (
+        '_materials',
+        '_textures',
+        '_spawn_egg',
+        '_animations',
+        '_animation_controllers',
+        '_geometries',
+        '_render_controllers',
+        '_particle_effects',
+    )
+    _identifier_path = (
+        "minecraft:client_entity", "description", "identifier")
     class ConnectMaterial(NamedTuple):
         '''A reference inside the entity to a material'''
         short_name: str
@@ -1181,7 +1711,7 @@ class RpEntity(_McFileJsonSingle['RpEntities']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._materials: Optional[Tuple[RpEntity.ConnectMaterial, ...]] = None
@@ -1196,15 +1726,6 @@ class RpEntity(_McFileJsonSingle['RpEntities']):
         self._particle_effects: Optional[
             Tuple[RpEntity.ConnectParticle, ...]] = None
 
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:client_entity" / "description" /
-            "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
-
     @property
     def materials(self) -> Tuple[ConnectMaterial, ...]:
         '''Returns a list of references to the materials from this file.'''
@@ -1336,6 +1857,7 @@ class RpEntity(_McFileJsonSingle['RpEntities']):
 
 class _AnimationController(_McFileJsonMulti[MCFILE_COLLECTION]):  # GENERIC
     '''Generic type for resource pack/behavior pack animation controllers.'''
+    __slots__ = ('_animations',)
     class ConnectAnim(NamedTuple):
         '''A reference from this file to an animation.'''
         short_name: str
@@ -1345,7 +1867,7 @@ class _AnimationController(_McFileJsonMulti[MCFILE_COLLECTION]):  # GENERIC
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._animations: Optional[
@@ -1379,24 +1901,21 @@ class _AnimationController(_McFileJsonMulti[MCFILE_COLLECTION]):  # GENERIC
         return self._animations
 
     def keys(self) -> Tuple[str, ...]:
-        id_walker = (self.json / "animation_controllers")
+        id_walker = self.json / "animation_controllers"
         if isinstance(id_walker.data, dict):
-            return tuple(
-                [k for k in id_walker.data.keys() if isinstance(k, str)])
+            return tuple(id_walker.data)
         return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        id_walker = (self.json / "animation_controllers")
-        if isinstance(id_walker.data, dict):
-            if key in id_walker.data:
-                return id_walker / key
-        raise KeyError(key)
+        return _get_json_item(self.json / "animation_controllers", key)
 
 class BpAnimationController(_AnimationController['BpAnimationControllers']):
     '''Behavior pack animation controller.'''
+    __slots__ = ()
 
 class RpAnimationController(_AnimationController['RpAnimationControllers']):
     '''Resource pack animation controller.'''
+    __slots__ = ('_particle_effects', '_sound_effects')
     class ConnectParticle(NamedTuple):
         '''A reference from this file to a particle effect'''
         short_name: str
@@ -1412,7 +1931,7 @@ class RpAnimationController(_AnimationController['RpAnimationControllers']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[RpAnimationControllers]) -> None:
         super().__init__(path, owning_collection)
         self._particle_effects: Optional[
@@ -1472,25 +1991,23 @@ class RpAnimationController(_AnimationController['RpAnimationControllers']):
 
 class _Animation(_McFileJsonMulti[MCFILE_COLLECTION]):  # GENERIC
     '''Generic type for resource pack/behavior pack animations.'''
+    __slots__ = ()
     def keys(self) -> Tuple[str, ...]:
-        id_walker = (self.json / "animations")
+        id_walker = self.json / "animations"
         if isinstance(id_walker.data, dict):
-            return tuple(
-                [k for k in id_walker.data.keys() if isinstance(k, str)])
+            return tuple(id_walker.data)
         return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        id_walker = (self.json / "animations")
-        if isinstance(id_walker.data, dict):
-            if key in id_walker.data:
-                return id_walker / key
-        raise KeyError(key)
+        return _get_json_item(self.json / "animations", key)
 
 class BpAnimation(_Animation['BpAnimations']):
     '''Behavior pack animation file.'''
+    __slots__ = ()
 
 class RpAnimation(_Animation['RpAnimations']):
     '''Resource pack animation file.'''
+    __slots__ = ('_sound_effects', '_particle_effects')
     class ConnectSound(NamedTuple):
         '''A reference to a sound from this file'''
         short_name: str
@@ -1506,7 +2023,7 @@ class RpAnimation(_Animation['RpAnimations']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._sound_effects: Optional[
@@ -1570,45 +2087,29 @@ class RpAnimation(_Animation['RpAnimations']):
 
 class BpBlock(_McFileJsonSingle['BpBlocks']):
     '''Behavior pack block file.'''
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:block" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
+    __slots__ = ()
+    _identifier_path = ("minecraft:block", "description", "identifier")
 
 class BpItem(_McFileJsonSingle['BpItems']):
     '''Behavior pack item file.'''
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:item" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
+    __slots__ = ()
+    _identifier_path = ("minecraft:item", "description", "identifier")
 
 class RpItem(_McFileJsonSingle['RpItems']):
     '''Resource pack item file.'''
+    __slots__ = ('_icon',)
+    _identifier_path = ("minecraft:item", "description", "identifier")
 
     class ConnectItemTexture(NamedTuple):
         identifier: str
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._icon: Optional[RpItem.ConnectItemTexture] = None
 
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:item" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
-
     @property
     def icon(self) -> Optional[ConnectItemTexture]:
         '''Returns a reference to a item texture from this file.'''
@@ -1621,6 +2122,7 @@ class RpItem(_McFileJsonSingle['RpItems']):
 
 class BpLootTable(_McFileJsonSingle['BpLootTables']):
     '''Behavior pack loot table file.'''
+    __slots__ = ('_items', '_loot_tables')
     class ConnectLootTable(NamedTuple):
         identifier: str
         json: JsonWalker
@@ -1630,7 +2132,7 @@ class BpLootTable(_McFileJsonSingle['BpLootTables']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._items: Optional[
@@ -1640,12 +2142,7 @@ class BpLootTable(_McFileJsonSingle['BpLootTables']):
 
     @property
     def identifier(self) -> Optional[str]:
-        if (
-                self.owning_collection is None or
-                self.owning_collection.pack is None):
-            return None
-        return self.path.relative_to(
-            self.owning_collection.pack.path).as_posix()
+        return self._get_path_identifier(strip_suffix=False)
 
 
     @staticmethod
@@ -1671,7 +2168,7 @@ class BpLootTable(_McFileJsonSingle['BpLootTables']):
                 good_walkers.append(walker)
         result = JsonSplitWalker(good_walkers)
         more_results = walkers / 'pools' // int / 'entries' // int
-        if len(more_results.data) != 0:
+        if len(more_results) != 0:
             return result + BpLootTable._access_entries(more_results, type)
         return result
 
@@ -1701,71 +2198,47 @@ class BpLootTable(_McFileJsonSingle['BpLootTables']):
 
 class BpFunction(_McFileSingle['BpFunctions']):
     '''A minecraft function file.'''
+    __slots__ = ()
     @property
     def identifier(self) -> Optional[str]:
-        if (
-                self.owning_collection is None or
-                self.owning_collection.pack is None):
-            return None
-        return self.path.relative_to(
-            self.owning_collection.pack.path / 'functions'
-        ).with_suffix('').as_posix()
+        return self._get_path_identifier(strip_suffix=True)
 
 class RpSoundFile(_McFileSingle['RpSoundFiles']):
     '''A sound file.'''
+    __slots__ = ()
     @property
     def identifier(self) -> Optional[str]:
-        if (
-                self.owning_collection is None or
-                self.owning_collection.pack is None):
-            return None
-        return self.path.relative_to(
-            self.owning_collection.pack.path
-        ).with_suffix('').as_posix()
+        return self._get_path_identifier(strip_suffix=True)
 
 class RpTextureFile(_McFileSingle['RpTextureFiles']):
     '''The texture file.'''
+    __slots__ = ()
     @property
     def identifier(self) -> Optional[str]:
-        if (
-                self.owning_collection is None or
-                self.owning_collection.pack is None):
-            return None
-        return self.path.relative_to(
-            self.owning_collection.pack.path
-        ).with_suffix('').as_posix()
+        return self._get_path_identifier(strip_suffix=True)
 
 class BpSpawnRule(_McFileJsonSingle['BpSpawnRules']):
     '''The spawn rule file.'''
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "minecraft:spawn_rules" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
+    __slots__ = ()
+    _identifier_path = ("minecraft:spawn_rules", "description", "identifier")
 
 class BpTrade(_McFileJsonSingle['BpTrades']):
     '''The trade file.'''
+    __slots__ = ('_items',)
     class ConnectItem(NamedTuple):
         identifier: str
         trade_wants: bool
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._items: Optional[Tuple[BpLootTable.ConnectItem, ...]] = None
 
     @property
     def identifier(self) -> Optional[str]:
-        if (
-                self.owning_collection is None or
-                self.owning_collection.pack is None):
-            return None
-        return self.path.relative_to(
-            self.owning_collection.pack.path).as_posix()
+        return self._get_path_identifier(strip_suffix=False)
 
     @property
     def items(self) -> Tuple[ConnectItem, ...]:
@@ -1785,6 +2258,7 @@ class BpTrade(_McFileJsonSingle['BpTrades']):
 
 class RpModel(_McFileJsonMulti['RpModels']):
     '''The model file.'''
+    __slots__ = ()
     @property
     def format_version(self) -> Tuple[int, ...]:
         '''
@@ -1795,8 +2269,7 @@ class RpModel(_McFileJsonMulti['RpModels']):
         try:
             id_walker = self.json / 'format_version'
             if isinstance(id_walker.data, str):
-                format_version = tuple(
-                    [int(i) for i in id_walker.data.split('.')])
+                format_version = _parse_version(id_walker.data)
         except:  # Guessing the format version instead
             id_walker = self.json / 'minecraft:geometry'
             if isinstance(id_walker.data, list):
@@ -1807,8 +2280,8 @@ class RpModel(_McFileJsonMulti['RpModels']):
         result: List[str] = []
         if self.format_version <= (1, 10, 0):
             if isinstance(self.json.data, dict):
-                for k in self.json.data.keys():
-                    if isinstance(k, str) and k.startswith('geometry.'):
+                for k in self.json.data:
+                    if k.startswith('geometry.'):
                         result.append(k)
         else:  # Probably something > 1.10.0
             id_walker = (
@@ -1827,17 +2300,15 @@ class RpModel(_McFileJsonMulti['RpModels']):
             if isinstance(self.json.data, dict):
                 return self.json / key
         else:  # Probably something > 1.10.0
-            id_walker = (
-                self.json / 'minecraft:geometry' // int)
-            for model in id_walker:
-                if not isinstance(
-                        (model / 'description' / 'identifier' / key).data,
-                        Exception):
+            for model in self.json / 'minecraft:geometry' // int:
+                if (model / 'description' / 'identifier').data == key:
                     return model
         raise KeyError(key)
 
 class RpParticle(_McFileJsonSingle['RpParticles']):
     '''The particle file.'''
+    __slots__ = ('_particle_effects', '_texture')
+    _identifier_path = ("particle_effect", "description", "identifier")
     class ConnectParticle(NamedTuple):
         identifier: str
         event: str
@@ -1848,21 +2319,13 @@ class RpParticle(_McFileJsonSingle['RpParticles']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._particle_effects: Optional[
             Tuple[RpParticle.ConnectParticle, ...]] = None
         self._texture: Optional[RpParticle.ConnectTexture] = None
 
-    @property
-    def identifier(self) -> Optional[str]:
-        id_walker = (
-            self.json / "particle_effect" / "description" / "identifier")
-        if isinstance(id_walker.data, str):
-            return id_walker.data
-        return None
-
     @property
     def particle_effects(self) -> Tuple[ConnectParticle, ...]:
         '''Returns a reference to particle effects from this file.'''
@@ -1893,6 +2356,7 @@ class RpParticle(_McFileJsonSingle['RpParticles']):
 
 class RpRenderController(_McFileJsonMulti['RpRenderControllers']):
     '''The render controller file.'''
+    __slots__ = ('_geometries', '_textures', '_materials')
     class ConnectGeo(NamedTuple):
         '''A reference from this render controller to a geometry'''
         short_name: str
@@ -1915,7 +2379,7 @@ class RpRenderController(_McFileJsonMulti['RpRenderControllers']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[MCFILE_COLLECTION]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._geometries: Optional[Tuple[RpRenderController.ConnectGeo]] = None
@@ -2017,21 +2481,17 @@ class RpRenderController(_McFileJsonMulti['RpRenderControllers']):
         return self._materials
 
     def keys(self) -> Tuple[str, ...]:
-        id_walker = (self.json / "render_controllers")
+        id_walker = self.json / "render_controllers"
         if isinstance(id_walker.data, dict):
-            return tuple(
-                [k for k in id_walker.data.keys() if isinstance(k, str)])
+            return tuple(id_walker.data)
         return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        id_walker = (self.json / "render_controllers")
-        if isinstance(id_walker.data, dict):
-            if key in id_walker.data:
-                return id_walker / key
-        raise KeyError(key)
+        return _get_json_item(self.json / "render_controllers", key)
 
 class BpRecipe(_McFileJsonMulti['BpRecipes']):
     '''The recipe file.'''
+    __slots__ = ('_items',)
     class ConnectItemType(Enum):
         '''The type of the item connection'''
         INPUT = auto()
@@ -2050,12 +2510,11 @@ class BpRecipe(_McFileJsonMulti['BpRecipes']):
         json: JsonWalker
 
     def __init__(
-            self, path: Path,
+            self, path: Union[Path, str],
             owning_collection: Optional[BpRecipes]) -> None:
         super().__init__(path, owning_collection=owning_collection)
         self._items: Optional[Tuple[BpRecipe.ConnectItem, ...]] = None
 
-
     @property
     def items(self) -> Tuple[BpRecipe.ConnectItem, ...]:
         '''Returns a list of references to items from this file.'''
@@ -2136,12 +2595,7 @@ class BpRecipe(_McFileJsonMulti['BpRecipes']):
 
     def keys(self) -> Tuple[str, ...]:
         id_walker = (
-            self.json / 'minecraft:recipe_shaped' +
-            self.json /'minecraft:recipe_furnace' +
-            self.json /'minecraft:recipe_shapeless' +
-            self.json /'minecraft:recipe_brewing_mix' +
-            self.json /'minecraft:recipe_brewing_container'
-        ) / "description"  / "identifier"
+            self._get_recipe_walkers() / "description"  / "identifier")
         result: List[str] = []
         for identifier_walker in id_walker.data:
             if isinstance(identifier_walker.data, str):
@@ -2149,17 +2603,23 @@ class BpRecipe(_McFileJsonMulti['BpRecipes']):
         return tuple(result)
 
     def __getitem__(self, key: str) -> JsonWalker:
-        recipes = (
+        for recipe in self._get_recipe_walkers():
+            if (recipe / "description"  / "identifier").data == key:
+                return recipe
+        raise KeyError(key)
+
+    def _get_recipe_walkers(self) -> JsonSplitWalker:
+        '''
+        Used internally - returns :class:`JsonSplitWalker` with the recipes
+        from this file (one for every type of recipe that exists in the file).
+        '''
+        return (
             self.json / 'minecraft:recipe_shaped' +
             self.json /'minecraft:recipe_furnace' +
             self.json /'minecraft:recipe_shapeless' +
             self.json /'minecraft:recipe_brewing_mix' +
             self.json /'minecraft:recipe_brewing_container'
-        ) 
-        for recipe in recipes:
-            if (recipe / "description"  / "identifier").data == key:
-                return recipe
-        raise KeyError(key)
+        )
 
 # OBJECT COLLECTIONS (IMPLEMENTATIONS)
 class _McFileCollectionSingle(_McFileCollection[MCPACK, MCFILE_SINGLE]):
@@ -2167,197 +2627,186 @@ class _McFileCollectionSingle(_McFileCollection[MCPACK, MCFILE_SINGLE]):
     Collection of files where each file represent exactly one object of certain type
     (a collection of :class:`_McFileSingle` objects).
     '''
-    def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
-        for obj in self.objects:
-            if obj.identifier is not None:
-                result.append(obj.identifier)
-        return tuple(set(result))
-
-    def _quick_access_list_views(self) -> Tuple[
-            Dict[Path, List[str]], Dict[str, List[MCFILE_SINGLE]]]:
-        path_ids: Dict[Path, List[str]] = {}
-        id_items: Dict[str, List[MCFILE_SINGLE]] = {}
-        for obj in self.objects:
-            if obj.identifier is None:
-                continue
-            # path -> identifier
-            if obj.path in path_ids:
-                path_ids[obj.path].append(obj.identifier)
-            else:
-                path_ids[obj.path] = [obj.identifier]
-            # identifier -> item
-            if obj.path in id_items:
-                id_items[obj.identifier].append(obj)
-            else:
-                id_items[obj.identifier] = [obj]
-        return (path_ids, id_items)
+    __slots__ = ()
+    def _extract_ids(self, obj: MCFILE_SINGLE) -> Tuple[str, ...]:
+        identifier = obj.identifier
+        if identifier is None:
+            return tuple()
+        return (identifier,)
 
 class _McFileCollectionMulti(_McFileCollection[MCPACK, MCFILE_MULTI]):
     '''
     Collection of files where each file can represent multiple objects of certain type
     (a collection of :class:`_McFileMulti` objects).
     '''
-    def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
-        for obj in self.objects:
-            result.extend(obj.keys())
-        return tuple(set(result))
-
-    def _quick_access_list_views(self) -> Tuple[
-            Dict[Path, List[str]], Dict[str, List[MCFILE_MULTI]]]:
-        path_ids: Dict[Path, List[str]] = {}
-        id_items: Dict[str, List[MCFILE_MULTI]] = {}
-        for obj in self.objects:
-            # path -> identifier
-            for identifier in obj.keys():
-                if obj.path in path_ids:
-                    path_ids[obj.path].append(identifier)
-                else:
-                    path_ids[obj.path] = [identifier]
-                # identifier -> item
-                if obj.path in id_items:
-                    id_items[identifier].append(obj)
-                else:
-                    id_items[identifier] = [obj]
-        return (path_ids, id_items)
+    __slots__ = ()
+    def _extract_ids(self, obj: MCFILE_MULTI) -> Tuple[str, ...]:
+        return obj.keys()
 
 class BpEntities(_McFileCollectionSingle[BehaviorPack, BpEntity]):
     '''A collection of behavior pack entities files.'''
+    __slots__ = ()
     pack_path = 'entities'
-    file_patterns = ('**/*.json',)
+    file_suffixes = ('.json',)
 
-    def _make_collection_object(self, path: Path) -> BpEntity:
+    def _make_collection_object(self, path: Union[Path, str]) -> BpEntity:
         return BpEntity(path, self)
 
 class RpEntities(_McFileCollectionSingle[ResourcePack, RpEntity]):
     '''A collection of resource pack entities files.'''
+    __slots__ = ()
     pack_path = 'entity'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpEntity:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> RpEntity:
         return RpEntity(path, self)
 
 class BpAnimationControllers(
         _McFileCollectionMulti[BehaviorPack, BpAnimationController]):
     '''A collection of behavior pack animation controllers files.'''
+    __slots__ = ()
     pack_path = 'animation_controllers'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpAnimationController:
+    file_suffixes = ('.json',)
+    def _make_collection_object(
+            self, path: Union[Path, str]) -> BpAnimationController:
         return BpAnimationController(path, self)
 
 class RpAnimationControllers(
         _McFileCollectionMulti[ResourcePack, RpAnimationController]):
     '''A collection of resource pack animation controllers files.'''
+    __slots__ = ()
     pack_path = 'animation_controllers'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpAnimationController:
+    file_suffixes = ('.json',)
+    def _make_collection_object(
+            self, path: Union[Path, str]) -> RpAnimationController:
         return RpAnimationController(path, self)
 
 class BpAnimations(_McFileCollectionMulti[BehaviorPack, BpAnimation]):
     '''A collection of behavior pack animations files.'''
+    __slots__ = ()
     pack_path = 'animations'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpAnimation:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> BpAnimation:
         return BpAnimation(path, self)
 
 class RpAnimations(_McFileCollectionMulti[ResourcePack, RpAnimation]):
     '''A collection of resource pack animations files.'''
+    __slots__ = ()
     pack_path = 'animations'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpAnimation:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> RpAnimation:
         return RpAnimation(path, self)
 
 class BpBlocks(_McFileCollectionSingle[BehaviorPack, BpBlock]):
     '''A collection of behavior pack blocks files.'''
+    __slots__ = ()
     pack_path = 'blocks'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpBlock:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> BpBlock:
         return BpBlock(path, self)
 
 class BpItems(_McFileCollectionSingle[BehaviorPack, BpItem]):
     '''A collection of behavior pack items files.'''
+    __slots__ = ()
     pack_path = 'items'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpItem:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> BpItem:
         return BpItem(path, self)
 
 class RpItems(_McFileCollectionSingle[ResourcePack, RpItem]):
     '''A collection of resource pack items files.'''
+    __slots__ = ()
     pack_path = 'items'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpItem:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> RpItem:
         return RpItem(path, self)
 
 class BpLootTables(_McFileCollectionSingle[BehaviorPack, BpLootTable]):
     '''A collection of behavior pack loot tables files.'''
+    __slots__ = ()
     pack_path = 'loot_tables'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpLootTable:
+    file_suffixes = ('.json',)
+    _ids_from_paths = True
+    def _make_collection_object(self, path: Union[Path, str]) -> BpLootTable:
         return BpLootTable(path, self)
 
 class BpFunctions(_McFileCollectionSingle[BehaviorPack, BpFunction]):
     '''A collection of functions files.'''
+    __slots__ = ()
     pack_path = 'functions'
-    file_patterns = ('**/*.mcfunction',)
-    def _make_collection_object(self, path: Path) -> BpFunction:
+    _identifier_base = 'functions'
+    file_suffixes = ('.mcfunction',)
+    _ids_from_paths = True
+    def _make_collection_object(self, path: Union[Path, str]) -> BpFunction:
         return BpFunction(path, self)
 
 class RpSoundFiles(_McFileCollectionSingle[ResourcePack, RpSoundFile]):
     '''A collection of sound files.'''
+    __slots__ = ()
     pack_path = 'sounds'
-    file_patterns = ('**/*.ogg', '**/*.wav', '**/*.mp3', '**/*.fsb',)
-    def _make_collection_object(self, path: Path) -> RpSoundFile:
+    file_suffixes = ('.ogg', '.wav', '.mp3', '.fsb',)
+    _ids_from_paths = True
+    def _make_collection_object(self, path: Union[Path, str]) -> RpSoundFile:
         return RpSoundFile(path, self)
 
 class RpTextureFiles(_McFileCollectionSingle[ResourcePack, RpTextureFile]):
     '''A collection of texture files.'''
+    __slots__ = ()
     pack_path = 'textures'
 
-    file_patterns = ('**/*.tga', '**/*.png', '**/*.jpg',)
-    def _make_collection_object(self, path: Path) -> RpTextureFile:
+    file_suffixes = ('.tga', '.png', '.jpg',)
+    _ids_from_paths = True
+    def _make_collection_object(self, path: Union[Path, str]) -> RpTextureFile:
         return RpTextureFile(path, self)
 
 class BpSpawnRules(_McFileCollectionSingle[BehaviorPack, BpSpawnRule]):
     '''A collection of behavior pack spawn rules files.'''
+    __slots__ = ()
     pack_path = 'spawn_rules'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpSpawnRule:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> BpSpawnRule:
         return BpSpawnRule(path, self)
 
 class BpTrades(_McFileCollectionSingle[BehaviorPack, BpTrade]):
     '''A collection of trade files.'''
+    __slots__ = ()
     pack_path = 'trading'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpTrade:
+    file_suffixes = ('.json',)
+    _ids_from_paths = True
+    def _make_collection_object(self, path: Union[Path, str]) -> BpTrade:
         return BpTrade(path, self)
 
 class RpModels(_McFileCollectionMulti[ResourcePack, RpModel]):
     '''A collection of model files.'''
+    __slots__ = ()
     pack_path = 'models'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpModel:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> RpModel:
         return RpModel(path, self)
 
 class RpParticles(_McFileCollectionSingle[ResourcePack, RpParticle]):
     '''A collection of particles files.'''
+    __slots__ = ()
     pack_path = 'particles'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpParticle:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> RpParticle:
         return RpParticle(path, self)
 
 class RpRenderControllers(
         _McFileCollectionMulti[ResourcePack, RpRenderController]):
     '''A collection of render controller files.'''
+    __slots__ = ()
     pack_path = 'render_controllers'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> RpRenderController:
+    file_suffixes = ('.json',)
+    def _make_collection_object(
+            self, path: Union[Path, str]) -> RpRenderController:
         return RpRenderController(path, self)
 
 class BpRecipes(_McFileCollectionMulti[BehaviorPack, BpRecipe]):
     '''A collection of recipe files.'''
+    __slots__ = ()
     pack_path = 'recipes'
-    file_patterns = ('**/*.json',)
-    def _make_collection_object(self, path: Path) -> BpRecipe:
+    file_suffixes = ('.json',)
+    def _make_collection_object(self, path: Union[Path, str]) -> BpRecipe:
         return BpRecipe(path, self)
 
 # SPECIAL PACK FILES - ONE FILE PER PACK (GENERICS)
@@ -2366,6 +2815,7 @@ class _UniqueMcFile(Generic[MCPACK], ABC):
     A file which is unique from a pack. E.g. You can have only one blocks.json file in
     a resource pack.
     '''
+    __slots__ = ('_pack', '_path', '_pack_path_cache')
     pack_path: ClassVar[str]
 
     def __init__(
@@ -2383,6 +2833,8 @@ class _UniqueMcFile(Generic[MCPACK], ABC):
 
         self._pack: Optional[MCPACK] = pack  # read only (use pack)
         self._path: Optional[Path] = path  # read only (use path)
+        # The path of the pack and the path created from it (use path)
+        self._pack_path_cache: Optional[Tuple[Path, Path]] = None
 
     @property
     def pack(self) -> Optional[MCPACK]:
@@ -2393,33 +2845,42 @@ class _UniqueMcFile(Generic[MCPACK], ABC):
     def path(self) -> Path:
         '''The path to this file.'''
         if self.pack is not None:  # Get path from pack
-            return self.pack.path / self.__class__.pack_path
+            pack_path = self.pack.path
+            # The path of the pack is a public attribute, the cached path is
+            # used only if it didn't change
+            cache = self._pack_path_cache
+            if cache is None or cache[0] is not pack_path:
+                cache = (pack_path, pack_path / self.__class__.pack_path)
+                self._pack_path_cache = cache
+            return cache[1]
         if self._path is None:
             raise AttributeError("Can't get 'path' attribute.")
         return self._path
 
 class _UniqueMcFileJson(_UniqueMcFile[MCPACK]):
     '''A unique JSON file from a pack.'''
+    __slots__ = ('_json',)
     def __init__(
             self,  *,
             path: Optional[Path]=None,
             pack: Optional[MCPACK]=None) -> None:
         super().__init__(path=path, pack=pack)
-        self._json: JsonWalker = JsonWalker(None)
-        try:
-            with self.path.open('r') as f:
-                self._json = JsonWalker.load(f, cls=JSONCDecoder)
-        except:
-            pass  # self._json remains None walker
+        self._json: Optional[JsonWalker] = None  # Lazy evaluation
 
     @property
     def json(self) -> JsonWalker:
         '''
         A :class:`JsonWalker` with the content of this JSON file.
         '''
+        if self._json is None:
+            try:
+                self._json = _load_jsonc_file(self.path)
+            except:
+                self._json = JsonWalker(None)
         return self._json
 
 class _UniqueMcFileJsonMulti(_UniqueMcFileJson[MCPACK]):
+    __slots__ = ()
     @abstractmethod
     def keys(self) -> Tuple[str, ...]:
         '''
@@ -2443,8 +2904,14 @@ class _UniqueMcFileJsonMultiQuery(Generic[UNIQUE_MC_FILE_JSON_MULTI]):
     Used in :class:`Project` to provide methods for finding Minecraft objects
     inside unique files that belong to a project.
     '''
+    __slots__ = ('pack_files', '_pack_files_reversed')
     def __init__(self, pack_files: Sequence[UNIQUE_MC_FILE_JSON_MULTI]):
-        self.pack_files = pack_files
+        self.pack_files: Tuple[UNIQUE_MC_FILE_JSON_MULTI, ...] = tuple(
+            pack_files)
+        # The files from the packs which are later on the list override the
+        # files from the earlier packs so __getitem__ searches them first
+        self._pack_files_reversed: Tuple[
+            UNIQUE_MC_FILE_JSON_MULTI, ...] = self.pack_files[::-1]
 
     def __getitem__(self, key: str) -> JsonWalker:
         '''
@@ -2454,11 +2921,10 @@ class _UniqueMcFileJsonMultiQuery(Generic[UNIQUE_MC_FILE_JSON_MULTI]):
         :class key: the identifier of a Minecraft object contained in this
             file.
         '''
-        for pack_file in reversed(self.pack_files):
+        for pack_file in self._pack_files_reversed:
             try:
-                aaa=  pack_file[key]
-                return aaa
-            except:
+                return pack_file[key]
+            except KeyError:
                 pass
         raise KeyError(key)
 
@@ -2467,14 +2933,14 @@ class _UniqueMcFileJsonMultiQuery(Generic[UNIQUE_MC_FILE_JSON_MULTI]):
         The list of the identifiers that can be used for __getitem__ method
         of this collection.
         '''
-        result: List[str] = []
-        for pack_file in self.pack_files:
-            result.extend(pack_file.keys())
-        return tuple(set(result))
+        # dict.fromkeys removes the duplicates and keeps the order
+        return tuple(dict.fromkeys(chain.from_iterable(
+            pack_file.keys() for pack_file in self.pack_files)))
 
 # SPECIAL PACK FILES - ONE FILE/PACK (IMPLEMENTATIONS)
 class RpSoundDefinitionsJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''sounds_definitions.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'sounds/sound_definitions.json'
 
     @property
@@ -2488,8 +2954,7 @@ class RpSoundDefinitionsJson(_UniqueMcFileJsonMulti[ResourcePack]):
         try:
             id_walker = self.json / 'format_version'
             if isinstance(id_walker.data, str):
-                format_version = tuple(
-                    [int(i) for i in id_walker.data.split('.')])
+                format_version = _parse_version(id_walker.data)
         except:  # Guessing the format version instead
             id_walker = self.json / 'sound_definitions'
             if isinstance(id_walker.data, dict):
@@ -2497,72 +2962,56 @@ class RpSoundDefinitionsJson(_UniqueMcFileJsonMulti[ResourcePack]):
         return format_version
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         if self.format_version <= (1, 14, 0):
             id_walker = self.json / 'sound_definitions'
             if isinstance(id_walker.data, dict):
-                for key in id_walker.data.keys():
-                    if isinstance(key, str):
-                        result.append(key)
+                return tuple(id_walker.data)
         else:
             if isinstance(self.json.data, dict):
-                for key in self.json.data.keys():
-                    if isinstance(key, str) and key != 'format_version':
-                        result.append(key)
-        return tuple(result)
+                return tuple(
+                    [k for k in self.json.data if k != 'format_version'])
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
         if key != 'format_version':
             if self.format_version <= (1, 14, 0):
-                walker = self.json / 'sound_definitions' / key
-                if not isinstance(walker.data, Exception):
-                    return walker
+                walker = self.json / 'sound_definitions'
             else:
-                walker = self.json / key
-                if not isinstance(walker.data, Exception):
-                    return walker
+                walker = self.json
+            return _get_json_item(walker, key)
         raise KeyError(key)
 
 class RpBiomesClientJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''biomes_client.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'biomes_client.json'
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         walker = self.json / 'biomes'
         if isinstance(walker.data, dict):
-            for key in walker.data.keys():
-                if isinstance(key, str):
-                    result.append(key)
-        return tuple(result)
+            return tuple(walker.data)
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        result = self.json / 'biomes' / key
-        if isinstance(result.data, Exception):
-            raise KeyError(key)
-        return result
+        return _get_json_item(self.json / 'biomes', key)
 
 class RpItemTextureJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''item_texture.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'textures/item_texture.json'
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         walker = self.json / 'texture_data'
         if isinstance(walker.data, dict):
-            for key in walker.data.keys():
-                if isinstance(key, str):
-                    result.append(key)
-        return tuple(result)
+            return tuple(walker.data)
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        result = self.json / 'texture_data' / key
-        if isinstance(result.data, Exception):
-            raise KeyError(key)
-        return result
+        return _get_json_item(self.json / 'texture_data', key)
 
 class RpFlipbookTexturesJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''flipbook_texture.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'textures/flipbook_textures.json'
 
     def keys(self) -> Tuple[str, ...]:
@@ -2571,7 +3020,8 @@ class RpFlipbookTexturesJson(_UniqueMcFileJsonMulti[ResourcePack]):
         for walker in walkers:
             if isinstance(walker.data, str):
                 result.append(walker.data)
-        return tuple(set(result))
+        # dict.fromkeys removes the duplicates and keeps the order
+        return tuple(dict.fromkeys(result))
 
     def __getitem__(self, key: str) -> JsonWalker:
         walkers = self.json // int / 'flipbook_texture'
@@ -2582,58 +3032,43 @@ class RpFlipbookTexturesJson(_UniqueMcFileJsonMulti[ResourcePack]):
 
 class RpTerrainTextureJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''terrain_texture.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'textures/terrain_texture.json'
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         walker = self.json / 'texture_data'
         if isinstance(walker.data, dict):
-            for key in walker.data.keys():
-                if isinstance(key, str):
-                    result.append(key)
-        return tuple(result)
+            return tuple(walker.data)
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        result = self.json / 'texture_data' / key
-        if isinstance(result.data, Exception):
-            raise KeyError(key)
-        return result
+        return _get_json_item(self.json / 'texture_data', key)
 
 class RpBlocksJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''blocks.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'blocks.json'
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         if isinstance(self.json.data, dict):
-            for key in self.json.data.keys():
-                if isinstance(key, str):
-                    result.append(key)
-        return tuple(result)
+            return tuple(self.json.data)
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        result = self.json / key
-        if isinstance(result.data, Exception):
-            raise KeyError(key)
-        return result
+        return _get_json_item(self.json, key)
 
 class RpMusicDefinitionsJson(_UniqueMcFileJsonMulti[ResourcePack]):
     '''music_definitions.json file.'''
+    __slots__ = ()
     pack_path: ClassVar[str] = 'sounds/music_definitions.json'
 
     def keys(self) -> Tuple[str, ...]:
-        result: List[str] = []
         if isinstance(self.json.data, dict):
-            for key in self.json.data.keys():
-                if isinstance(key, str):
-                    result.append(key)
-        return tuple(result)
+            return tuple(self.json.data)
+        return tuple()
 
     def __getitem__(self, key: str) -> JsonWalker:
-        result = self.json / key
-        if isinstance(result.data, Exception):
-            raise KeyError(key)
-        return result
+        return _get_json_item(self.json, key)
 
 
 # SOUNDS.JSON
@@ -2659,6 +3094,9 @@ def _get_float_tuple_range(
 
 class RpSoundsJson(_UniqueMcFileJson[ResourcePack]):
     '''sounds.json file.'''
+    __slots__ = (
+        'block_sounds', 'entity_sounds', 'individual_event_sounds',
+        'interactive_block_sounds', 'interactive_entity_sounds')
     pack_path: ClassVar[str] = 'sounds.json'
 
     def __init__(
@@ -2678,6 +3116,7 @@ class _RpSoundsJsonPart(ABC):
     A part of sounds.json file. An abstract base class for 5 different types
     of the objects contained in sounds.json.
     '''
+    __slots__ = ('sounds_json',)
     def __init__(self, sounds_json: RpSoundsJson):
         self.sounds_json = sounds_json
 
@@ -2686,6 +3125,7 @@ class _PermanentJsonWalkerContainer(ABC):
     Holds reference to JsonWalker which can't be changed. An abstract base
     class for classes that represent some unmuteable part of JSON file.
     '''
+    __slots__ = ('_json',)
     def __init__(self, json: JsonWalker) -> None:
         self._json: JsonWalker = json
 
@@ -2701,6 +3141,7 @@ class SjBlockSounds(_RpSoundsJsonPart):
     '''
     The block_sounds part of the sounds.json file.
     '''
+    __slots__ = ()
     @property
     def json(self):
         '''
@@ -2739,6 +3180,7 @@ class SjBlockSoundsBlock(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->block_sounds->[block].
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjBlockSounds) -> None:
         super().__init__(json)
         self._owning_collection: SjBlockSounds = owning_collection
@@ -2811,6 +3253,7 @@ class SjBlockSoundsBlockEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->block_sounds->[block]->events->[event].
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjBlockSoundsBlock) -> None:
         super().__init__(json)
         self._owning_collection: SjBlockSoundsBlock = owning_collection
@@ -2860,6 +3303,7 @@ class SjEntitySounds(_RpSoundsJsonPart):
     '''
     The entity_sounds part of the sounds.json file.
     '''
+    __slots__ = ()
     @property
     def json(self) -> JsonWalker:
         '''
@@ -2907,6 +3351,7 @@ class SjEntitySoundsDefaults(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->entity_sounds->defaults.
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjEntitySounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -2969,6 +3414,7 @@ class SjEntitySoundsDefaultsEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->entity_sounds->defaults->events->[event].
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjEntitySoundsDefaults) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3027,6 +3473,7 @@ class SjEntitySoundsEntity(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->entity_sounds->entities->[entity]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjEntitySounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3088,6 +3535,7 @@ class SjEntitySoundsEntityEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->entity_sounds->entities->[entity]->events->[event]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjEntitySoundsEntity) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3147,6 +3595,7 @@ class SjIndividualEventSounds(_RpSoundsJsonPart):
     '''
     The individual_event_sounds part of the sounds.json file.
     '''
+    __slots__ = ()
     @property
     def json(self) -> JsonWalker:
         '''
@@ -3189,6 +3638,7 @@ class SjIndividualEventSoundsEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->individual_event_sounds->events->[event]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjIndividualEventSounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3235,6 +3685,7 @@ class SjInteractiveBlockSounds(_RpSoundsJsonPart):
     '''
     The interactive_sounds->block_sounds part of the sounds.json file.
     '''
+    __slots__ = ()
     @property
     def json(self) -> JsonWalker:
         '''
@@ -3275,6 +3726,7 @@ class SjInteractiveBlockSoundsBlock(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->interactive_sounds->block_sounds->[block]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveBlockSounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3345,6 +3797,7 @@ class SjInteractiveBlockSoundsBlockEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->interactive_sounds->block_sounds->[block]->events->[event]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveBlockSoundsBlock) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3393,6 +3846,7 @@ class SjInteractiveEntitySounds(_RpSoundsJsonPart):
     '''
     The interactive_sounds->entity_sounds part of the sounds.json file.
     '''
+    __slots__ = ()
     @property
     def json(self) -> JsonWalker:
         '''
@@ -3443,6 +3897,7 @@ class SjInteractiveEntitySoundsDefaults(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->interactive_sounds->entity_sounds->defaults
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveEntitySounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3505,6 +3960,7 @@ class SjInteractiveEntitySoundsDefaultsEvent(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->interactive_sounds->entity_sounds->defaults->events->[event]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveEntitySoundsDefaults) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3564,6 +4020,7 @@ class SjInteractiveEntitySoundsEntity(_PermanentJsonWalkerContainer):
     A class with :class:`JsonWalker` with the content of
     sounds.json->interactive_sounds->entity_sounds->entities->[entity]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveEntitySounds) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3627,6 +4084,7 @@ class SjInteractiveEntitySoundsEntityEvent(_PermanentJsonWalkerContainer):
     sounds.json->interactive_sounds->entity_sounds->entities->[entity]->
     events->[event]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveEntitySoundsEntity) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
@@ -3683,6 +4141,7 @@ class SjInteractiveEntitySoundsEntityEventBlock(_PermanentJsonWalkerContainer):
     sounds.json->interactive_sounds->entity_sounds->entities->[entity]->
     events->[event]->[block]
     '''
+    __slots__ = ('_owning_collection',)
     def __init__(self, json: JsonWalker, owning_collection: SjInteractiveEntitySoundsEntityEvent) -> None:
         super().__init__(json)
         self._owning_collection = owning_collection
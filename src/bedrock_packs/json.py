@@ -63,54 +63,81 @@ Here are some code examples:
     # {"a": {"b": "Hello"}, "c": ["abc", "abc", "abc", "Test"]}
 '''
 from __future__ import annotations
-from typing import Callable, Dict, Generic, IO, Iterator, List, NewType, Tuple, Type, TypeVar, Union, Optional
+from typing import Callable, Dict, Generic, IO, Iterable, Iterator, List, NewType, Tuple, Type, TypeVar, Union, Optional
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from functools import lru_cache
 import json
 from json import scanner, JSONDecodeError  # type: ignore
-from json.decoder import WHITESPACE, WHITESPACE_STR, scanstring  # type: ignore
+from json.decoder import scanstring  # type: ignore
+
+try:
+    import orjson  # Optional, faster parser used by JsonWalker.loads
+except ImportError:
+    orjson = None
+
+# Integers that don't fit in 64 bits are parsed by some versions of orjson
+# as floats instead of being rejected. Every such integer has at least 20
+# digits, the texts that have 20 digits in a row are parsed by json module.
+_LONG_DIGITS_STR = re.compile(r'[0-9]{20}')
+_LONG_DIGITS_BYTES = re.compile(rb'[0-9]{20}')
+
+def _has_long_digits(json_text: Union[str, bytes]) -> bool:
+    '''
+    Used internally - checks if the text has 20 or more digits in a row.
+    '''
+    if isinstance(json_text, bytes):
+        return _LONG_DIGITS_BYTES.search(json_text) is not None
+    return _LONG_DIGITS_STR.search(json_text) is not None
 
 
 
 # JSON Decoder
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 INLINE_COMMENT = re.compile(r'//[^\n]*\n?', FLAGS)
+# Written as an "unrolled loop" which can't backtrack
+MULTILINE_COMMENT = re.compile(r'/[*][^*]*[*]+(?:[^/*][^*]*[*]+)*/', FLAGS)
+# Not used by the decoder anymore (the comments are skipped with
+# COMMENTS_AND_WHITESPACES). Kept for backward compatibility because they are
+# public names of this module.
 INLINE_COMMENT_STRING_START='//'
-MULTILINE_COMMENT = re.compile(r"/[*]([^*]|([*][^/]))*[*]+/", FLAGS)
 MULTILINE_COMMENT_STRING_START='/*'
+# Any sequence of whitespaces and comments (matches empty string)
+COMMENTS_AND_WHITESPACES = re.compile(
+    r'(?:[ \t\n\r]+|' + INLINE_COMMENT.pattern + '|' +
+    MULTILINE_COMMENT.pattern + ')*')
+# The characters that can start a match of COMMENTS_AND_WHITESPACES (a set
+# and not a str because '' in str is True)
+COMMENTS_AND_WHITESPACES_START = frozenset(' \t\n\r/')
 
 
 def parse_object(
     s_and_end, strict, scan_once, object_hook, object_pairs_hook,
-    memo=None, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
-    _ilcs=INLINE_COMMENT_STRING_START, _ilc=INLINE_COMMENT.match,
-    _mlcs=MULTILINE_COMMENT_STRING_START, _mlc=MULTILINE_COMMENT.match
+    memo=None, _skip=COMMENTS_AND_WHITESPACES.match,
+    _skip_start=COMMENTS_AND_WHITESPACES_START, _intern=sys.intern,
+    _scanstring=scanstring
 ):
     '''
     Modified json.decoder.JSONObject function from standard json module
     (python 3.7.7).
     '''
     s, end = s_and_end
+    s_len = len(s)
     pairs = []
     pairs_append = pairs.append
-    # Backwards compatibility
-    if memo is None:
-        memo = {}
-    memo_get = memo.setdefault
-    # Use a slice to prevent IndexError from being raised, the following
-    # check will raise a more specific ValueError if the string is empty
-    nextchar = s[end:end + 1]
+    # The keys are interned instead of using the memo so the same keys from
+    # different files share memory (memo is kept for backwards compatibility)
+    # Characters are read with a bounds check instead of slicing
+    # (s[end:end + 1]) to avoid creating a slice object for every read. ''
+    # at the end of the string makes the following checks raise more specific
+    # ValueError.
+    nextchar = s[end] if end < s_len else ''
     # Normally we expect nextchar == '"'
     if nextchar != '"':
-        while True:  # Handle comments and whitespaces
-            if nextchar in _ws:
-                end = _w(s, end).end()
-            elif s[end:].startswith(_ilcs):
-                end = _ilc(s, end).end()
-            elif s[end:].startswith(_mlcs):
-                end = _mlc(s, end).end()
-            else:
-                break
-            nextchar = s[end:end + 1]
+        end = _skip(s, end).end()  # Handle comments and whitespaces
+        nextchar = s[end] if end < s_len else ''
 
         # Trivial empty object
         if nextchar == '}':
@@ -126,36 +153,18 @@ def parse_object(
                 "Expecting property name enclosed in double quotes", s, end)
     end += 1
     while True:
-        key, end = scanstring(s, end, strict)
-        key = memo_get(key, key)
+        key, end = _scanstring(s, end, strict)
+        key = _intern(key)
         # To skip some function call overhead we optimize the fast paths where
         # the JSON key separator is ": " or just ":".
-        if s[end:end + 1] != ':':
-            while True:  # Handle comments and whitespaces
-                if s[end:end + 1] in _ws:
-                    end = _w(s, end).end()
-                elif s[end:].startswith(_ilcs):
-                    end = _ilc(s, end).end()
-                elif s[end:].startswith(_mlcs):
-                    end = _mlc(s, end).end()
-                else:
-                    break
-            if s[end:end + 1] != ':':
+        if (s[end] if end < s_len else '') != ':':
+            end = _skip(s, end).end()  # Handle comments and whitespaces
+            if (s[end] if end < s_len else '') != ':':
                 raise JSONDecodeError("Expecting ':' delimiter", s, end)
         end += 1
 
-        try:
-            while True:  # Handle comments and whitespaces
-                if s[end] in _ws:
-                    end = _w(s, end).end()
-                elif s[end:].startswith(_ilcs):
-                    end = _ilc(s, end).end()
-                elif s[end:].startswith(_mlcs):
-                    end = _mlc(s, end).end()
-                else:
-                    break
-        except IndexError:
-            pass
+        if (s[end] if end < s_len else '') in _skip_start:
+            end = _skip(s, end).end()  # Handle comments and whitespaces
 
         try:
             value, end = scan_once(s, end)
@@ -163,20 +172,10 @@ def parse_object(
             raise JSONDecodeError("Expecting value", s, err.value) from None
         pairs_append((key, value))
 
-        try:
-            nextchar = s[end]
-            while True:  # Handle comments and whitespaces
-                if nextchar in _ws:
-                    end = _w(s, end).end()
-                elif s[end:].startswith(_ilcs):
-                    end = _ilc(s, end).end()
-                elif s[end:].startswith(_mlcs):
-                    end = _mlc(s, end).end()
-                else:
-                    break
-                nextchar = s[end]
-        except IndexError:
-            nextchar = ''
+        nextchar = s[end] if end < s_len else ''
+        if nextchar in _skip_start:
+            end = _skip(s, end).end()  # Handle comments and whitespaces
+            nextchar = s[end] if end < s_len else ''
         end += 1
 
         if nextchar == '}':
@@ -184,16 +183,10 @@ def parse_object(
         elif nextchar != ',':
             raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
 
-        while True:  # Handle comments and whitespaces
-            if s[end] in _ws:
-                end = _w(s, end).end()
-            elif s[end:].startswith(_ilcs):
-                end = _ilc(s, end).end()
-            elif s[end:].startswith(_mlcs):
-                end = _mlc(s, end).end()
-            else:
-                break
-        nextchar = s[end:end + 1]
+        nextchar = s[end] if end < s_len else ''
+        if nextchar in _skip_start:
+            end = _skip(s, end).end()  # Handle comments and whitespaces
+            nextchar = s[end] if end < s_len else ''
         end += 1
         if nextchar != '"':
             raise JSONDecodeError(
@@ -208,27 +201,18 @@ def parse_object(
 
 
 def parse_array(
-    s_and_end, scan_once, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
-    _ilcs=INLINE_COMMENT_STRING_START, _ilc=INLINE_COMMENT.match,
-    _mlcs=MULTILINE_COMMENT_STRING_START, _mlc=MULTILINE_COMMENT.match
+    s_and_end, scan_once, _skip=COMMENTS_AND_WHITESPACES.match,
+    _skip_start=COMMENTS_AND_WHITESPACES_START
 ):
     '''
     Modified json.decoder.JSONArray function from standard module json
     (python 3.7.7).
     '''
     s, end = s_and_end
+    s_len = len(s)
     values = []
-    nextchar = s[end:end + 1]
-    while True:  # Handle comments and whitespaces
-        if nextchar in _ws:
-            end = _w(s, end).end()
-        elif s[end:].startswith(_ilcs):
-            end = _ilc(s, end).end()
-        elif s[end:].startswith(_mlcs):
-            end = _mlc(s, end).end()
-        else:
-            break
-        nextchar = s[end:end + 1]
+    end = _skip(s, end).end()  # Handle comments and whitespaces
+    nextchar = s[end] if end < s_len else ''
 
     # Look-ahead for trivial empty array
     if nextchar == ']':
@@ -240,18 +224,11 @@ def parse_array(
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         _append(value)
-        nextchar = s[end:end + 1]
-
-        while True:  # Handle comments and whitespaces
-            if nextchar in _ws:
-                end = _w(s, end).end()
-            elif s[end:].startswith(_ilcs):
-                end = _ilc(s, end).end()
-            elif s[end:].startswith(_mlcs):
-                end = _mlc(s, end).end()
-            else:
-                break
-            nextchar = s[end:end + 1]
+
+        nextchar = s[end] if end < s_len else ''
+        if nextchar in _skip_start:
+            end = _skip(s, end).end()  # Handle comments and whitespaces
+            nextchar = s[end] if end < s_len else ''
         end += 1
 
         if nextchar == ']':
@@ -259,18 +236,8 @@ def parse_array(
         elif nextchar != ',':
             raise JSONDecodeError("Expecting ',' delimiter", s, end - 1)
 
-        try:
-            while True:  # Handle comments and whitespaces
-                if s[end] in _ws:
-                    end = _w(s, end).end()
-                elif s[end:].startswith(_ilcs):
-                    end = _ilc(s, end).end()
-                elif s[end:].startswith(_mlcs):
-                    end = _mlc(s, end).end()
-                else:
-                    break
-        except IndexError:
-            pass
+        if (s[end] if end < s_len else '') in _skip_start:
+            end = _skip(s, end).end()  # Handle comments and whitespaces
 
     return values, end
 
@@ -288,27 +255,10 @@ class JSONCDecoder(json.JSONDecoder):
         # we need to recreate the internal scan function ..
         self.scan_once = scanner.py_make_scanner(self)
 
-    def decode(
-        self, s, _w=WHITESPACE.match,
-        _ws=WHITESPACE_STR,
-        _ilcs=INLINE_COMMENT_STRING_START, _ilc=INLINE_COMMENT.match,
-        _mlcs=MULTILINE_COMMENT_STRING_START, _mlc=MULTILINE_COMMENT.match
-    ):
-        idx = 0
-        try:
-            while True:  # Handle comments and whitespaces
-                if s[idx] in _ws:
-                    idx = _w(s, idx).end()
-                elif s[idx:].startswith(_ilcs):
-                    idx = _ilc(s, idx).end()
-                elif s[idx:].startswith(_mlcs):
-                    idx = _mlc(s, idx).end()
-                else:
-                    break
-        except IndexError:
-            pass
+    def decode(self, s, _skip=COMMENTS_AND_WHITESPACES.match):
+        idx = _skip(s, 0).end()  # Handle comments and whitespaces
         obj, end = self.raw_decode(s, idx)
-        end = _w(s, end).end()
+        end = _skip(s, end).end()  # Handle comments and whitespaces
         if end != len(s):
             raise JSONDecodeError("Extra data", s, end)
         return obj
@@ -325,8 +275,7 @@ class CompactEncoder(json.JSONEncoder):
         self.indent = -1
         self.respect_indent = True
 
-    def _is_primitive(self, obj):
-        return isinstance(obj, (int, bool, str, float))
+    _PRIMITIVE_TYPES = (int, bool, str, float)
 
     def encode(self, obj):
         '''
@@ -337,7 +286,7 @@ class CompactEncoder(json.JSONEncoder):
         >>> CompactEncoder().encode({"foo": ["bar", "baz"]})
         '{\\n\\t"foo": ["bar", "baz"]\\n}'
         '''
-        return ''.join([i for i in self.iterencode(obj)])
+        return ''.join(self.iterencode(obj))
 
     def iterencode(self, obj):
         '''
@@ -351,65 +300,65 @@ class CompactEncoder(json.JSONEncoder):
         ... CompactEncoder().encode(item)
         True
         '''
-        self.indent += 1
-        if self.respect_indent:
-            ind = self.indent*'\t'
-        else:
-            ind = ''
+        yield self._encode_obj(obj, 0)
+
+    def _encode_obj(self, obj, depth):
+        '''
+        Used internally - returns the string representation of an object
+        without the indentation of its first line.
+
+        :param obj: the object to encode.
+        :param depth: the depth of the object in encoded JSON (used to
+            indent its content).
+        '''
         if isinstance(obj, dict):
             if len(obj) == 0:
-                yield f"{ind}{{}}"
+                return "{}"
+            if self.sort_keys is True:
+                obj_iter = sorted(iter(obj.items()))
             else:
-                body = []
-                if self.sort_keys is True:
-                    obj_iter = sorted(iter(obj.items()))
-                else:
-                    obj_iter = obj.items()
-                for k, v in obj_iter:
-                    body.extend([
-                        f'{j[:self.indent]}"{k}": {j[self.indent:]}'
-                        for j in self.iterencode(v)
-                    ])
-                body_str = ",\n".join(body)
-                yield (
-                    f'{ind}{{\n'
-                    f'{body_str}\n'
-                    f'{ind}}}'
-                )
+                obj_iter = obj.items()
+            ind = depth*'\t'
+            child_ind = ind + '\t'
+            body_str = ",\n".join([
+                f'{child_ind}"{k}": {self._encode_obj(v, depth + 1)}'
+                for k, v in obj_iter
+            ])
+            return f'{{\n{body_str}\n{ind}}}'
         elif isinstance(obj, (list, tuple)):
-            primitive_list = True
+            # Try to encode as a list of primitives (in one line) and give up
+            # on first non-primitive item
+            primitive_types = self._PRIMITIVE_TYPES
+            encode_primitive = self._encode_primitive
+            items = []
             for i in obj:
-                if not self._is_primitive(i):
-                    primitive_list = False
+                if not isinstance(i, primitive_types):
                     break
-            if primitive_list:
-                body = []
-                self.respect_indent = False
-                for i in obj:
-                    body.extend([j for j in self.iterencode(i)])
-                self.respect_indent = True
-                yield f'{ind}[{", ".join(body)}]'
-            else:
-                body = []
-                for i in obj:
-                    body.extend([j for j in self.iterencode(i)])
-                body_str = ",\n".join(body)
-                yield (
-                    f'{ind}[\n'
-                    f'{body_str}\n'
-                    f'{ind}]'
-                )
-        elif self._is_primitive(obj):
-            if isinstance(obj, str):
-                obj_str = obj.replace("\\", "\\\\").replace('"', '\\"')
-                yield f'{ind}"{obj_str}"'
+                items.append(encode_primitive(i))
             else:
-                yield f'{ind}{str(obj).lower()}'
+                return f'[{", ".join(items)}]'
+            ind = depth*'\t'
+            child_ind = ind + '\t'
+            body_str = ",\n".join([
+                f'{child_ind}{self._encode_obj(i, depth + 1)}' for i in obj
+            ])
+            return f'[\n{body_str}\n{ind}]'
+        elif isinstance(obj, self._PRIMITIVE_TYPES):
+            return self._encode_primitive(obj)
         elif obj is None:
-            yield f'{ind}null'
-        else:
-            raise TypeError('Object of type set is not JSON serializable')
-        self.indent -= 1
+            return 'null'
+        raise TypeError('Object of type set is not JSON serializable')
+
+    @staticmethod
+    def _encode_primitive(obj):
+        '''
+        Used internally - returns the string representation of an int, bool,
+        str or float.
+        '''
+        if isinstance(obj, str):
+            obj_str = obj.replace("\\", "\\\\").replace('"', '\\"')
+            return f'"{obj_str}"'
+        return str(obj).lower()
 
 # JSON path
 
@@ -418,16 +367,32 @@ JSON = Union[Dict, List, str, float, int, bool, None]
 JSON_KEY = Union[str, int]
 JSON_SPLIT_KEY = Union[str, Type[int], Type[str], None, type(Ellipsis)]
 JSON_WALKER_DATA = Union[Dict, List, str, float, int, bool, None, Exception]
+# Exact types of the JSON values created by the json module. Checking them
+# with a set lookup is faster than isinstance with a tuple of types.
+_JSON_TYPES = frozenset((dict, list, str, float, int, bool, type(None)))
+
+
+@lru_cache(maxsize=256)
+def _compile_fullmatch(pattern: str) -> Callable:
+    '''
+    Returns the fullmatch method of compiled regular expression. The
+    results are cached to avoid looking up the pattern in the cache of the
+    re module for every key of every walked dictionary.
+    '''
+    return re.compile(pattern).fullmatch
+
 
 class JsonWalker:
     '''
     Safe access to data accessed with json.load without risk of exceptions.
     '''
+    __slots__ = ('_data', '_parent', '_parent_key')
+
     def __init__(
             self, data: JSON_WALKER_DATA, *,
             parent: Optional[JsonWalker]=None,
             parent_key: Optional[JSON_KEY]=None):
-        if not isinstance(
+        if type(data) not in _JSON_TYPES and not isinstance(
                 data, (Exception, dict, list, str, float, int, bool, type(None))):
             raise ValueError('Input data is not JSON.')
         self._data: JSON_WALKER_DATA = data
@@ -464,23 +429,77 @@ class JsonWalker:
     def loads(json_text: Union[str, bytes], **kwargs) -> JsonWalker:
         '''
         Create :class:`JsonWalker` from string with :code:`json.loads()` .
+        If orjson is installed and no keyword arguments are given, the text
+        is parsed with :code:`orjson.loads()` first and :code:`json.loads()`
+        is used only if that fails. Texts with numbers that have 20 or more
+        digits (possibly integers that don't fit in 64 bits) are always
+        parsed with :code:`json.loads()`.
 
         :rises: Any type of exception risen by :code:`json.loads()` function
             (:class:`ValueError`).
         '''
+        if orjson is not None and not kwargs and not _has_long_digits(
+                json_text):
+            try:
+                return JsonWalker(orjson.loads(json_text))
+            except ValueError:
+                pass  # Let json module parse it or raise its own error
         data = json.loads(json_text, **kwargs)
         return JsonWalker(data)
 
+    @staticmethod
+    def loads_with(
+            decoder: json.JSONDecoder,
+            json_text: Union[str, bytes]) -> JsonWalker:
+        '''
+        Create :class:`JsonWalker` from string with :code:`decoder.decode()`
+        . Unlike :meth:`loads` with the :code:`cls` argument, this lets you
+        reuse the same decoder for many texts instead of creating a new one
+        for each of them.
+
+        :param decoder: the decoder to use (e.g. :class:`JSONCDecoder`).
+        :param json_text: the text to decode. If it's bytes, its encoding is
+            detected the same way as in :code:`json.loads()` .
+        :rises: Any type of exception risen by :code:`decoder.decode()`
+            (:class:`ValueError`).
+        '''
+        if isinstance(json_text, (bytes, bytearray)):
+            json_text = json_text.decode(
+                json.detect_encoding(json_text), 'surrogatepass')
+        return JsonWalker(decoder.decode(json_text))
+
     @staticmethod
     def load(json_file: IO, **kwargs) -> JsonWalker:
         '''
         Create :class:`JsonWalker` from file input with :code:`json.load()` .
+        Uses the same fast path as :meth:`loads` .
 
         :rises: Any type of exception risen by :code:`json.load()` function
             (:class:`ValueError`).
         '''
-        data = json.load(json_file, **kwargs)
-        return JsonWalker(data)
+        return JsonWalker.loads(json_file.read(), **kwargs)
+
+    @staticmethod
+    def load_many(
+            paths: Iterable[Union[str, PathLike]], workers: int = 8,
+            **kwargs) -> List[JsonWalker]:
+        '''
+        Create a list of :class:`JsonWalker` objects from multiple files. The
+        files are read and parsed in a thread pool, so reading of the files
+        overlaps with parsing.
+
+        :param paths: the paths to the files.
+        :param workers: the maximal number of threads used for loading.
+        :param kwargs: the keyword arguments passed to :meth:`loads` .
+        :rises: The first exception risen while reading or parsing any of the
+            files (:class:`OSError` or :class:`ValueError`).
+        '''
+        def load_file(path: Union[str, PathLike]) -> JsonWalker:
+            with open(path, 'rb') as f:
+                return JsonWalker.loads(f.read(), **kwargs)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(load_file, paths))
 
     @property
     def data(self) -> JSON_WALKER_DATA:
@@ -612,14 +631,12 @@ class JsonWalker:
         the JSON file (loaded recursively from JSON parents).
         '''
         result: List[JSON_KEY] = []
-        parent = self
-        try:
-            while True:
-                result.append(parent.parent_key)
-                parent = parent.parent
-        except KeyError:
-            pass
-        return tuple(reversed(result))
+        walker: Optional[JsonWalker] = self
+        while walker is not None and walker._parent_key is not None:
+            result.append(walker._parent_key)
+            walker = walker._parent
+        result.reverse()
+        return tuple(result)
 
     def __truediv__(self, key: JSON_KEY) -> JsonWalker:
         '''
@@ -632,7 +649,7 @@ class JsonWalker:
         '''
         try:
             return JsonWalker(
-                self.data[key],  # type: ignore
+                self._data[key],  # type: ignore
                 parent=self, parent_key=key)
         except Exception as e:  # index out of list bounds
             return JsonWalker(e, parent=self, parent_key=key)
@@ -683,9 +700,10 @@ class JsonWalker:
         # REGEX DICT ITEM
         elif isinstance(key, str):
             if isinstance(self.data, dict):
+                fullmatch = _compile_fullmatch(key)
                 result: List[JsonWalker] = []
                 for k, v in self.data.items():
-                    if re.fullmatch(key, k):
+                    if fullmatch(k):
                         result.append(JsonWalker(
                             v, parent=self, parent_key=k))
                 return JsonSplitWalker(result)
@@ -719,8 +737,16 @@ class JsonSplitWalker:
     Multiple :class:`JsonWalker` objects grouped together. This class can be
     browse JSON file in multiple places at once.
     '''
-    def __init__(self, data: List[JsonWalker]) -> None:
-        self._data: List[JsonWalker] = data
+    __slots__ = ('_data_source', '_data')
+
+    def __init__(self, data: Iterable[JsonWalker]) -> None:
+        # The walkers are evaluated lazily, on first access to data
+        self._data_source: Optional[Iterable[JsonWalker]] = None
+        self._data: Optional[List[JsonWalker]] = None
+        if isinstance(data, list):
+            self._data = data
+        else:
+            self._data_source = data
 
     @property
     def data(self) -> List[JsonWalker]:
@@ -728,6 +754,10 @@ class JsonSplitWalker:
         The list of the :class:`JsonWalker` objects contained in this
             :class:`JSONSplitWalker`.
         '''
+        if self._data is not None:
+            return self._data
+        self._data = list(self._data_source)  # type: ignore
+        self._data_source = None
         return self._data
 
     def __truediv__(self, key: JSON_KEY) -> JsonSplitWalker:
@@ -739,12 +769,13 @@ class JsonSplitWalker:
 
         :param key: a json key (list index or object field name)
         '''
-        result = []
+        return JsonSplitWalker(self._iter_truediv(key))
+
+    def _iter_truediv(self, key: JSON_KEY) -> Iterator[JsonWalker]:
         for walker in self.data:
             new_walker = walker / key
             if not isinstance(new_walker.data, Exception):
-                result.append(new_walker)
-        return JsonSplitWalker(result)
+                yield new_walker
 
     def __floordiv__(self, key: JSON_SPLIT_KEY) -> JsonSplitWalker:
         '''
@@ -753,12 +784,25 @@ class JsonSplitWalker:
         the results.
 
         :param key: a json key (list index or object field name)
+
+        :raises:
+            :class:`TypeError` - invalid input data type
+
+            :class:`re.error` - invlid regular expression.
         '''
-        result: List[JsonWalker] = []
+        if not (
+                key is None or key is int or key is str or key is ... or
+                isinstance(key, str)):
+            raise TypeError(
+                'Key must be a regular expression or one of the values: '
+                'str, int, or None')
+        if isinstance(key, str):
+            _compile_fullmatch(key)  # Raise re.error now, not on access
+        return JsonSplitWalker(self._iter_floordiv(key))
+
+    def _iter_floordiv(self, key: JSON_SPLIT_KEY) -> Iterator[JsonWalker]:
         for walker in self.data:
-            new_walker = walker // key
-            result.extend(new_walker.data)
-        return JsonSplitWalker(result)
+            yield from walker // key
 
     def __add__(self, other: Union[JsonSplitWalker, JsonWalker]) -> JsonSplitWalker:
         '''
@@ -778,3 +822,10 @@ class JsonSplitWalker:
         '''
         for i in self.data:
             yield i
+
+    def __len__(self) -> int:
+        '''
+        The number of the :class:`JsonWalker` objects contained in this
+        object (empty :class:`JsonSplitWalker` is falsy).
+        '''
+        return len(self.data)
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+from bedrock_packs import (
+    BehaviorPack, BpAnimations, BpEntities, RpModels, _walk_files)
+
+
+def test_renamed_file_can_be_found_by_new_path(tmp_path):
+    (tmp_path / 'a.json').write_text(
+        '{"minecraft:entity": {"description": {"identifier": "x:a"}}}')
+    entities = BpEntities(path=tmp_path)
+    entity = entities['x:a']
+    entity.path = entity.path.with_name('renamed.json')
+    assert entities[entity.path:'x:a'] is entity
+    assert entities[str(entity.path):] is entity
+
+def test_renamed_function_has_new_identifier(tmp_path):
+    (tmp_path / 'functions').mkdir()
+    (tmp_path / 'functions' / 'a.mcfunction').write_text('say a')
+    functions = BehaviorPack(tmp_path).functions
+    function = functions['a']
+    function.path = function.path.with_name('b.mcfunction')
+    assert function.identifier == 'b'
+    assert functions['b'] is function
+    assert 'a' not in functions.keys()
+
+def test_identifier_follows_json_edits(tmp_path):
+    (tmp_path / 'a.json').write_text(
+        '{"minecraft:entity": {"description": {"identifier": "x:a"}}}')
+    entity = BpEntities(path=tmp_path)['x:a']
+    description = (entity.json / 'minecraft:entity' / 'description').data
+    description['identifier'] = 'x:changed'
+    assert entity.identifier == 'x:changed'
+
+def test_model_follows_json_edits(tmp_path):
+    (tmp_path / 'm.geo.json').write_text(
+        '{"format_version": "1.12.0", "minecraft:geometry": ['
+        '{"description": {"identifier": "geometry.a"}}]}')
+    model = RpModels(path=tmp_path).objects[0]
+    assert model.keys() == ('geometry.a',)
+    added = {"description": {"identifier": "geometry.added"}}
+    (model.json / 'minecraft:geometry').data.append(added)
+    assert model.keys() == ('geometry.a', 'geometry.added')
+    assert model['geometry.added'].data is added
+
+def test_animation_keys_follow_json_edits(tmp_path):
+    (tmp_path / 'a.json').write_text(
+        '{"animations": {"animation.a": {}}}')
+    animation = BpAnimations(path=tmp_path).objects[0]
+    assert animation.keys() == ('animation.a',)
+    (animation.json / 'animations').data['animation.b'] = {}
+    assert animation.keys() == ('animation.a', 'animation.b')
+    assert animation['animation.b'].data == {}
+
+def test_walk_files_keeps_glob_order(tmp_path):
+    for directory in ('', 'b', 'b/y', 'b/x', 'a', 'a/z', 'c'):
+        (tmp_path / directory).mkdir(parents=True, exist_ok=True)
+        for name in ('1.json', '2.json', '3.txt'):
+            (tmp_path / directory / name).write_text('{}')
+    assert list(_walk_files(tmp_path, ('.json',))) == [
+        str(p) for p in tmp_path.glob('**/*.json')]
+
+def test_walk_files_ignores_case_on_case_insensitive_platforms(
+        tmp_path, monkeypatch):
+    (tmp_path / 'a.JSON').write_text('{}')
+    # Same as os.path.normcase on Windows
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+    assert list(_walk_files(tmp_path, ('.json',))) == [
+        str(tmp_path / 'a.JSON')]
+
+def test_path_lookup_ignores_case_on_case_insensitive_platforms(
+        tmp_path, monkeypatch):
+    (tmp_path / 'a.json').write_text(
+        '{"minecraft:entity": {"description": {"identifier": "x:a"}}}')
+    # Same as os.path.normcase on Windows
+    monkeypatch.setattr(os.path, 'normcase', str.lower)
+    entities = BpEntities(path=tmp_path)
+    assert entities[str(tmp_path / 'A.JSON'):] is entities['x:a']
+
+def test_missing_path_key_error_has_the_original_key(tmp_path):
+    entities = BpEntities(path=tmp_path)
+    key = slice(tmp_path / 'missing.json', 'x:a', None)
+    with pytest.raises(KeyError) as exc_info:
+        entities[key]
+    assert exc_info.value.args == (key,)
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from bedrock_packs import BpEntity
+from bedrock_packs.json import JsonSplitWalker, JsonWalker
+
+
+DUPLICATE_IDENTIFIER = '''{
+    // comment
+    "minecraft:entity": {
+        "description": {
+            "identifier": "x:first",
+            "identifier": "x:second"
+        }
+    }
+}'''
+
+def test_identifier_uses_last_duplicate_key(tmp_path):
+    path = tmp_path / 'entity.json'
+    path.write_text(DUPLICATE_IDENTIFIER)
+    entity = BpEntity(path, None)
+    assert entity.identifier == 'x:second'
+    assert entity.identifier == (
+        entity.json / "minecraft:entity" / "description" / "identifier").data
+
+def test_split_walker_long_add_chain():
+    root = JsonWalker({'a': list(range(3000))})
+    acc = JsonSplitWalker([])
+    for walker in root / 'a' // int:
+        acc = acc + walker
+    assert [w.data for w in acc.data] == list(range(3000))
+
+@pytest.mark.parametrize('text', [
+    '{"a": 18446744073709551616}',
+    b'{"a": -18446744073709551617}',
+    '{"a": 123456789012345678901234567890}'])
+def test_loads_keeps_big_integers(text):
+    assert JsonWalker.loads(text).data == json.loads(text)
+    assert isinstance(JsonWalker.loads(text).data['a'], int)